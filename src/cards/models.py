@@ -24,6 +24,11 @@ class Family(Enum):
     ARME = "Arme"
     DEMON = "Démon"
 
+    # Members are singletons compared by identity, so the C-level identity
+    # hash is equivalent to Enum's Python-level hash(self._name_) and much
+    # cheaper for the per-card count dicts built during ability resolution.
+    __hash__ = object.__hash__
+
 
 class CardClass(Enum):
     """Card classes representing different roles/archetypes."""
@@ -45,6 +50,9 @@ class CardClass(Enum):
     ARME = "Arme"
     DEMON = "Démon"
 
+    # Identity hash, see Family.
+    __hash__ = object.__hash__
+
 
 class CardType(Enum):
     """Types of cards in the game."""
@@ -229,7 +237,7 @@ class DemonCard(Card):
             raise ValueError(f"DemonCard must have family DEMON, got {self.family}")
 
 
-def _normalize_to_ascii(text: str) -> str:
+def normalize_to_ascii(text: str) -> str:
     """Normalize text to ASCII by removing accents and special characters.
 
     Uses Unicode NFD normalization to decompose characters, then removes
@@ -260,13 +268,13 @@ def create_card_id(family: Family, name: str, level: int | None = None) -> str:
         A snake_case identifier like "cyborg_lolo_le_gorille_1".
     """
     # Normalize name to snake_case with ASCII characters
-    normalized = _normalize_to_ascii(name)
+    normalized = normalize_to_ascii(name)
     normalized = normalized.replace(" ", "_")
     normalized = normalized.replace("'", "")
     normalized = normalized.replace("-", "_")
 
     # Normalize family prefix
-    family_prefix = _normalize_to_ascii(family.value).replace(" ", "_")
+    family_prefix = normalize_to_ascii(family.value).replace(" ", "_")
 
     if level is not None:
         return f"{family_prefix}_{normalized}_{level}"
@@ -6,20 +6,26 @@ on card counts and game state.
 """
 
 import re
-from collections import Counter
+from collections import Counter, namedtuple
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache
+from operator import attrgetter, is_, itemgetter
+from types import MappingProxyType
 
 from src.cards.models import (
+    Card,
     CardClass,
     CardType,
     ConditionalAbility,
     Family,
     Gender,
     ScalingAbility,
+    normalize_to_ascii,
 )
 
-from .state import GameState, PlayerState
+from .state import BoardCounts, GameState, PlayerState
 
 
 class UnmatchedBonusTextError(Exception):
@@ -59,10 +65,12 @@ class AbilityTarget(Enum):
     SPECIFIC = "specific"  # Affects a specific target (e.g., "defenseurs")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AbilityEffect:
     """A resolved ability effect.
 
+    Instances are immutable because parse_ability_effect caches and shares them.
+
     Attributes:
         attack_bonus: Bonus attack damage.
         health_bonus: Bonus health/defense.
@@ -84,7 +92,38 @@ class AbilityEffect:
     description: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class ConditionalEffect:
+    """A parsed conditional ability effect (e.g., a Dragon PO tier).
+
+    Instances are immutable because parse_conditional_effect caches and shares
+    them. Board-dependent bonuses keep their target; the resolver multiplies
+    them by the current count.
+
+    Attributes:
+        attack_multiplier: Attack multiplier (1 if none).
+        imblocable_damage: Imblocable damage dealt.
+        attack_bonus: Flat attack bonus.
+        health_bonus: Flat health bonus.
+        per_card_bonus: Attack bonus per card of per_card_family.
+        per_card_family: Family counted for per_card_bonus, if any.
+        to_class_bonus: Attack bonus per card of to_class_target.
+        to_class_target: Class or family counted for to_class_bonus, if any.
+        applies: Whether the effect has any recognised component.
+    """
+
+    attack_multiplier: int = 1
+    imblocable_damage: int = 0
+    attack_bonus: int = 0
+    health_bonus: int = 0
+    per_card_bonus: int = 0
+    per_card_family: Family | None = None
+    to_class_bonus: int = 0
+    to_class_target: CardClass | Family | None = None
+    applies: bool = False
+
+
+@dataclass(slots=True)
 class AbilityResolutionResult:
     """Result of resolving all abilities for a player.
 
@@ -105,7 +144,7 @@ class AbilityResolutionResult:
     class_counts: dict[CardClass, int] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConditionalAbilityResult:
     """Result of resolving conditional abilities (e.g., Dragon PO spending).
 
@@ -126,7 +165,7 @@ class ConditionalAbilityResult:
     effects: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PassiveAbilityResult:
     """Result of resolving passive abilities.
 
@@ -141,7 +180,7 @@ class PassiveAbilityResult:
     weapons_to_draw: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class BonusTextResult:
     """Result of parsing bonus_text effects.
 
@@ -224,7 +263,7 @@ class BonusTextResult:
     effects: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class InvocateurAbilityResult:
     """Result of resolving Invocateur demon summoning.
 
@@ -237,7 +276,7 @@ class InvocateurAbilityResult:
     effects: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class MontureAbilityResult:
     """Result of resolving Monture card draw ability.
 
@@ -250,398 +289,535 @@ class MontureAbilityResult:
     effects: list[str] = field(default_factory=list)
 
 
-# Regex patterns for parsing ability effects
-_ATK_PATTERN = re.compile(r"\+(\d+)\s*(?:ATQ|dgt|atq)", re.IGNORECASE)
-_PV_PATTERN = re.compile(r"\+(\d+)\s*(?:PV|pv|HP)", re.IGNORECASE)
-_SELF_DAMAGE_PATTERN = re.compile(r"-(\d+)\s*(?:PV|pv)", re.IGNORECASE)
-_IMBLOCABLE_PATTERN = re.compile(r"(\d+)\s*(?:dgt|dgts)?\s*imblocable", re.IGNORECASE)
-
+# Regex patterns for parsing ability effects.
+# Card texts are normalised once by the caller (see _normalize_text: lower case,
+# accents stripped) and every pattern is written in plain ASCII lower case
+# without re.IGNORECASE (as in src.cards.repository). This keeps the regex engine
+# off its case-folding path and lets it use literal prefixes instead of accent
+# character classes. Captured groups are therefore already normalised; only the
+# original text is used for display.
 # Patterns for conditional ability conditions
-_PO_CONDITION_PATTERN = re.compile(r"(\d+)\s*PO", re.IGNORECASE)
-
-# Patterns for Dragon conditional effects
-_DOUBLE_ATTACK_PATTERN = re.compile(r"double\s+son\s+attaque", re.IGNORECASE)
-_TRIPLE_ATTACK_PATTERN = re.compile(r"triple\s+son\s+attaque", re.IGNORECASE)
-_QUADRUPLE_ATTACK_PATTERN = re.compile(r"quadruple\s+son\s+attaque", re.IGNORECASE)
-_PER_CARD_BONUS_PATTERN = re.compile(
-    r"\+(\d+)\s*(?:ATQ|dgt)\s+par\s+(\w+)", re.IGNORECASE
-)
-_BONUS_TO_CLASS_PATTERN = re.compile(
-    r"\+(\d+)\s*(?:ATQ|dgt)\s+aux\s+(\w+)", re.IGNORECASE
+_PO_CONDITION_PATTERN = re.compile(r"(\d+)\s*po")
+
+# Single-pass scanner for Dragon conditional effects, built like
+# _EFFECT_SCAN_PATTERN below. A per-card ("+1 ATQ par raton") or class
+# ("+3 ATQ aux dragons") bonus starts at the same position as the plain attack
+# bonus it contains, so those fragments are listed first and also count as the
+# attack fragment at that position.
+_DRAGON_EFFECT_FRAGMENTS: tuple[tuple[str, str], ...] = (
+    (
+        "multiplier",
+        r"(?P<multiplier_value>double|triple|quadruple)\s+son\s+attaque",
+    ),
+    (
+        "per_card",
+        r"\+(?P<per_card_value>\d+)\s*(?:atq|dgt)\s+par\s+(?P<per_card_target>\w+)",
+    ),
+    (
+        "to_class",
+        r"\+(?P<to_class_value>\d+)\s*(?:atq|dgt)\s+aux\s+(?P<to_class_target>\w+)",
+    ),
+    ("atk", r"\+(?P<atk_value>\d+)\s*(?:atq|dgt)"),
+    ("pv", r"\+(?P<pv_value>\d+)\s*(?:pv|hp)"),
+    ("imblocable", r"(?P<imblocable_value>\d+)\s*(?:dgt|dgts)?\s*imblocable"),
+)
+_DRAGON_EFFECT_SCAN_PATTERN = re.compile(
+    "(?="
+    + "|".join(f"(?P<{name}>{source})" for name, source in _DRAGON_EFFECT_FRAGMENTS)
+    + ")",
+)
+_ATTACK_MULTIPLIERS: Mapping[str, int] = MappingProxyType(
+    {"double": 2, "triple": 3, "quadruple": 4}
 )
 
 # Patterns for Invocateur demon summoning
-_SUMMON_DIABLOTIN_PATTERN = re.compile(r"invoque\s+un\s+diablotin", re.IGNORECASE)
-_SUMMON_DEMON_MINEUR_PATTERN = re.compile(r"d[ée]mon\s+mineur", re.IGNORECASE)
-_SUMMON_SUCCUBE_PATTERN = re.compile(r"une?\s+succube", re.IGNORECASE)
-_SUMMON_DEMON_MAJEUR_PATTERN = re.compile(r"d[ée]mon\s+majeur", re.IGNORECASE)
+_SUMMON_DIABLOTIN_PATTERN = re.compile(r"invoque\s+un\s+diablotin")
+_SUMMON_DEMON_MINEUR_PATTERN = re.compile(r"demon\s+mineur")
+_SUMMON_SUCCUBE_PATTERN = re.compile(r"une?\s+succube")
+_SUMMON_DEMON_MAJEUR_PATTERN = re.compile(r"demon\s+majeur")
 
 # Patterns for Monture card draw
-_DRAW_COST_5_PATTERN = re.compile(r"piocher\s+une\s+carte\s+co[uû]t\s*5", re.IGNORECASE)
+_DRAW_COST_5_PATTERN = re.compile(r"piocher\s+une\s+carte\s+cout\s*5")
 
 # Patterns for bonus_text effects
 _BONUS_FOR_FAMILY_PATTERN = re.compile(
-    r"\+(\d+)\s*(?:ATQ|dgt|atq)\s+(?:pour|aux)\s+(?:les\s+)?(\w+)",
-    re.IGNORECASE,
-)
-_BONUS_FOR_CLASS_PATTERN = re.compile(
-    r"\+(\d+)\s*(?:ATQ|dgt|atq)\s+(?:pour|aux)\s+(?:les\s+)?(\w+)",
-    re.IGNORECASE,
+    r"\+(\d+)\s*(?:atq|dgt)\s+(?:pour|aux)\s+(?:les\s+)?(\w+)"
 )
 _BONUS_IF_THRESHOLD_PATTERN = re.compile(
-    r"\+(\d+)\s*(?:ATQ|dgt|atq)\s+si\s+(?:bonus\s+)?(\w+)\s+(\d+)",
-    re.IGNORECASE,
+    r"\+(\d+)\s*(?:atq|dgt)\s+si\s+(?:bonus\s+)?(\w+)\s+(\d+)"
 )
 
-# Patterns for conditional targeting
-_FOR_CLASS_PATTERN = re.compile(r"pour (?:les |tous les )?(\w+)", re.IGNORECASE)
-_IF_DEFENDERS_PATTERN = re.compile(r"si (?:\d+ )?d[ée]fenseurs?", re.IGNORECASE)
+# Single-pass scanner used by parse_ability_effect (attack, health, self-damage,
+# imblocable and class targeting). Every fragment is wrapped in a lookahead so
+# overlapping fragments (e.g. "+2 dgt imblocable" is both an attack and an
+# imblocable fragment) are all reported, exactly like separate searches. The
+# match kind is read from `lastgroup` and the value from the "<kind>_value" group.
+_EFFECT_FRAGMENTS: tuple[tuple[str, str], ...] = (
+    ("atk", r"\+(?P<atk_value>\d+)\s*(?:atq|dgt)"),
+    ("pv", r"\+(?P<pv_value>\d+)\s*(?:pv|hp)"),
+    ("self_damage", r"-(?P<self_damage_value>\d+)\s*pv"),
+    ("imblocable", r"(?P<imblocable_value>\d+)\s*(?:dgt|dgts)?\s*imblocable"),
+    ("for_class", r"pour (?:les |tous les )?(?P<for_class_value>\w+)"),
+    ("if_defenders", r"si (?:\d+ )?defenseurs?"),
+)
+_EFFECT_SCAN_PATTERN = re.compile(
+    "(?="
+    + "|".join(f"(?P<{name}>{source})" for name, source in _EFFECT_FRAGMENTS)
+    + ")",
+)
 
 # Patterns for bonus_text: negative ATK modifiers
-_NEGATIVE_ATK_FOR_CLASS_PATTERN = re.compile(
-    r"-(\d+)\s*ATQ\s+pour\s+(?:les\s+)?(\w+)", re.IGNORECASE
-)
+_NEGATIVE_ATK_FOR_CLASS_PATTERN = re.compile(r"-(\d+)\s*atq\s+pour\s+(?:les\s+)?(\w+)")
 
 # Patterns for bonus_text: on-attacked damage
 _ON_ATTACKED_DAMAGE_PATTERN = re.compile(
-    r"[Ii]nflige\s+(\d+)\s+(?:points?\s+de\s+)?dgt\s+quand\s+attaqu[ée]", re.IGNORECASE
+    r"inflige\s+(\d+)\s+(?:points?\s+de\s+)?dgt\s+quand\s+attaque"
 )
 
 # Patterns for bonus_text: per-turn imblocable
-_PER_TURN_IMBLOCABLE_PATTERN = re.compile(
-    r"\+(\d+)\s+dgt\s+imblocable/?tour", re.IGNORECASE
-)
+_PER_TURN_IMBLOCABLE_PATTERN = re.compile(r"\+(\d+)\s+dgt\s+imblocable/?tour")
 
 # Patterns for bonus_text: flat imblocable damage (e.g., "10 dgt imblocable")
-_FLAT_IMBLOCABLE_PATTERN = re.compile(
-    r"^(\d+)\s+(?:dgt|dgts)\s+imblocable$", re.IGNORECASE
-)
+_FLAT_IMBLOCABLE_PATTERN = re.compile(r"^(\d+)\s+(?:dgt|dgts)\s+imblocable$")
 
 # Patterns for bonus_text: lifelink ("Gagne en PV le nombre de DGT qu'elle inflige")
-_LIFELINK_PATTERN = re.compile(
-    r"[Gg]agne\s+en\s+PV\s+le\s+nombre\s+de\s+(?:DGT|dgt)", re.IGNORECASE
-)
+_LIFELINK_PATTERN = re.compile(r"gagne\s+en\s+pv\s+le\s+nombre\s+de\s+dgt")
 
 # Patterns for bonus_text: spell damage blocking
 _SPELL_DAMAGE_BLOCK_PATTERN = re.compile(
-    r"[Bb]loque\s+(\d+)\s+(?:points?\s+de\s+)?(?:dgt|DGT)\s+(?:des\s+sorts|magique|par\s+sort)",
-    re.IGNORECASE,
+    r"bloque\s+(\d+)\s+(?:points?\s+de\s+)?dgt\s+(?:des\s+sorts|magique|par\s+sort)",
 )
 
 # Patterns for bonus_text: PO generation
-_PO_PER_TURN_IF_PATTERN = re.compile(
-    r"\+(\d+)\s+PO\s*/?(?:tour)?\s+si\s+(\w+)\s+(\d+)", re.IGNORECASE
-)
-_PO_IF_NINJA_PATTERN = re.compile(r"\+(\d+)\s+PO\s+si\s+ninja\s+choisi", re.IGNORECASE)
+_PO_PER_TURN_IF_PATTERN = re.compile(r"\+(\d+)\s+po\s*/?(?:tour)?\s+si\s+(\w+)\s+(\d+)")
 _PO_PER_RATONS_PATTERN = re.compile(
-    r"\+(\d+)\s+PO\s+par\s+tranche\s+de\s+(\d+)\s+ratons", re.IGNORECASE
+    r"\+(\d+)\s+po\s+par\s+tranche\s+de\s+(\d+)\s+ratons"
 )
 
 # Patterns for bonus_text: raccoon family bonus
 _RACCOON_FAMILY_BONUS_PATTERN = re.compile(
-    r"[Ll]es\s+raccoon\s+[Ff]amilly\s+gagne\s+\+(\d+)\s+ATQ", re.IGNORECASE
+    r"les\s+raccoon\s+familly\s+gagne\s+\+(\d+)\s+atq"
 )
 
 # Patterns for bonus_text: solo ninja
-_SOLO_NINJA_PATTERN = re.compile(
-    r"\+(\d+)\s+ATQ\s+si\s+c'?est\s+le\s+seul\s+ninja", re.IGNORECASE
-)
+_SOLO_NINJA_PATTERN = re.compile(r"\+(\d+)\s+atq\s+si\s+c'?est\s+le\s+seul\s+ninja")
 
 # Patterns for bonus_text: card-specific bonuses
 _BONUS_IF_JOE_PATTERN = re.compile(
-    r"\+(\d+)\s+(?:dgts?|ATQ)\s+si\s+Joe\s+est\s+sur\s+plateau", re.IGNORECASE
+    r"\+(\d+)\s+(?:dgts?|atq)\s+si\s+joe\s+est\s+sur\s+plateau"
 )
 _BONUS_IF_REINE_PATTERN = re.compile(
-    r"\+(\d+)\s+ATQ\s+si\s+(?:la\s+)?Reine\s+est\s+en\s+jeu", re.IGNORECASE
+    r"\+(\d+)\s+atq\s+si\s+(?:la\s+)?reine\s+est\s+en\s+jeu"
 )
 _BONUS_IF_RATON_MIGNON_PATTERN = re.compile(
-    r"[Gg]agne\s+\+(\d+)\s+ATQ\s+si\s+Raton\s+Mignon", re.IGNORECASE
+    r"gagne\s+\+(\d+)\s+atq\s+si\s+raton\s+mignon"
 )
 _BONUS_IF_MAITRE_RAT_PATTERN = re.compile(
-    r"\+(\d+)\s+ATQ/?(?:\+\d+\s+PV)?\s+si\s+ma[îi]tre\s+rat", re.IGNORECASE
-)
-_PV_IF_MAITRE_RAT_PATTERN = re.compile(
-    r"\+(\d+)\s+PV\s+si\s+ma[îi]tre\s+rat", re.IGNORECASE
+    r"\+(\d+)\s+atq/?(?:\+\d+\s+pv)?\s+si\s+maitre\s+rat"
 )
+_PV_IF_MAITRE_RAT_PATTERN = re.compile(r"\+(\d+)\s+pv\s+si\s+maitre\s+rat")
 
 # Patterns for bonus_text: per-econome bonus
 _ATK_PER_ENEMY_ECONOME_PATTERN = re.compile(
-    r"[Gg]agne\s+\+(\d+)\s+ATQ\s+par\s+[ée]conomes?\s+sur\s+le\s+plateau\s+ennemi",
-    re.IGNORECASE,
-)
-
-# Patterns for bonus_text: demon-specific
-_IMBLOCABLE_FOR_DEMON_PATTERN = re.compile(
-    r"\+(\d+)\s+(?:dgts?|dgt)\s+imblocable\s+pour\s+le\s+d[ée]mon", re.IGNORECASE
-)
-_ATK_PV_FOR_DEMON_PATTERN = re.compile(
-    r"\+(\d+)\s+ATQ\s*/\s*-(\d+)\s+PV\s+pour\s+le\s+d[ée]mon", re.IGNORECASE
+    r"gagne\s+\+(\d+)\s+atq\s+par\s+economes?\s+sur\s+le\s+plateau\s+ennemi"
 )
 
 # Patterns for Lapincruste board limit expansion
 _LAPIN_BOARD_EXPANSION_PATTERN = re.compile(
-    r"(?:peut\s+poser|poser)\s+(\d+)\s+lapins?\s+suppl[ée]mentaires?\s+en\s+jeu",
-    re.IGNORECASE,
+    r"(?:peut\s+poser|poser)\s+(\d+)\s+lapins?\s+supplementaires?\s+en\s+jeu"
 )
 
 # Patterns for family board expansion ("+N cartes sur le plateau")
-_BOARD_EXPANSION_PATTERN = re.compile(
-    r"\+(\d+)\s+cartes?\s+sur\s+le\s+plateau", re.IGNORECASE
-)
+_BOARD_EXPANSION_PATTERN = re.compile(r"\+\d+\s+cartes?\s+sur\s+le\s+plateau")
 
 # Pattern for "pour tous les [family]" effects (e.g., "+2 ATQ pour tous les lapins")
-_FOR_ALL_FAMILY_PATTERN = re.compile(r"pour\s+tous\s+les\s+(\w+)", re.IGNORECASE)
+_FOR_ALL_FAMILY_PATTERN = re.compile(r"pour\s+tous\s+les\s+(\w+)")
 
 # Patterns for Lapin-specific bonus_text effects
 # "+X PV /tour si lapin Y" - PV per turn if lapin threshold
-_PV_PER_TURN_IF_PATTERN = re.compile(
-    r"\+(\d+)\s+PV\s*/?\s*tour\s+si\s+(\w+)\s+(\d+)", re.IGNORECASE
-)
+_PV_PER_TURN_IF_PATTERN = re.compile(r"\+(\d+)\s+pv\s*/?\s*tour\s+si\s+(\w+)\s+(\d+)")
 
 # "+X PO si Lapin Y / +Z PO si Lapin W" - Multi-threshold PO bonus
 _MULTI_PO_IF_PATTERN = re.compile(
-    r"\+(\d+)\s+PO\s+si\s+[Ll]apin\s+(\d+)\s*/\s*\+(\d+)\s+PO\s+si\s+[Ll]apin\s+(\d+)",
-    re.IGNORECASE,
+    r"\+(\d+)\s+po\s+si\s+lapin\s+(\d+)\s*/\s*\+(\d+)\s+po\s+si\s+lapin\s+(\d+)",
 )
 
 # "-X ATQ si [CardName]" - Card-conditional ATK penalty
 _ATK_PENALTY_IF_CARD_PATTERN = re.compile(
-    r"-(\d+)\s+ATQ\s+si\s+(.+?)(?:\s+est\s+(?:en\s+jeu|sur\s+le\s+plateau))?$",
-    re.IGNORECASE,
+    r"-(\d+)\s+atq\s+si\s+(.+?)(?:\s+est\s+(?:en\s+jeu|sur\s+le\s+plateau))?$"
 )
 
 # "Les [family] ont minimum X ATQ" - Minimum ATK floor
-_MIN_ATK_FLOOR_PATTERN = re.compile(
-    r"[Ll]es\s+(\w+)\s+ont\s+minimum\s+(\d+)\s+ATQ", re.IGNORECASE
-)
+_MIN_ATK_FLOOR_PATTERN = re.compile(r"les\s+(\w+)\s+ont\s+minimum\s+(\d+)\s+atq")
 
 # "retourner une carte de la pile, gagne son ATQ" - Deck reveal ATK bonus
 _DECK_REVEAL_ATK_PATTERN: re.Pattern[str] = re.compile(
-    r"retourner\s+une\s+carte\s+de\s+la\s+pile.*gagne\s+son\s+ATQ", re.IGNORECASE
+    r"retourner\s+une\s+carte\s+de\s+la\s+pile.*gagne\s+son\s+atq"
 )
 
 # Deck reveal with multiplier (Yetiir Lvl 2: "x2, jusqu'à la fin du tour")
 _DECK_REVEAL_MULT_PATTERN = re.compile(
-    r"1/tour.*\+ATQ\s+de\s+la\s+1[èe]re\s+carte\s+de\s+la\s+pile\s*(?:x(\d+))?",
-    re.IGNORECASE,
+    r"1/tour.*\+atq\s+de\s+la\s+1ere\s+carte\s+de\s+la\s+pile\s*(?:x(\d+))?"
 )
 
+# Average card ATK used for deck reveals when no game state is available
+_DECK_REVEAL_FALLBACK_ATK = 3
+
 # === NEW PATTERNS FOR BONUS_TEXT EFFECTS ===
 
 # Diplo synergy patterns
-_DIPLO_CROSS_ATK_PATTERN = re.compile(
-    r"\+(\d+)\s*ATQ\s+si\s+diplo\s+(terre|air|mer)", re.IGNORECASE
-)
-_DIPLO_CROSS_PV_PATTERN = re.compile(
-    r"\+(\d+)\s*PV\s+si\s+Diplo\s+(terre|air|mer)", re.IGNORECASE
-)
+_DIPLO_CROSS_ATK_PATTERN = re.compile(r"\+\d+\s*atq\s+si\s+diplo\s+(?:terre|air|mer)")
+_DIPLO_CROSS_PV_PATTERN = re.compile(r"\+\d+\s*pv\s+si\s+diplo\s+(?:terre|air|mer)")
 _DIPLO_COMBINED_PATTERN = re.compile(
-    r"Les?\s+\+(\d+)\s+ATQ\s+si\s+diplo\s+(\w+),\s*\+(\d+)\s+PV\s+si\s+Diplo\s+(\w+)",
-    re.IGNORECASE,
+    r"les?\s+\+(\d+)\s+atq\s+si\s+diplo\s+(\w+),\s*\+(\d+)\s+pv\s+si\s+diplo\s+(\w+)",
 )
 
 # Spell damage patterns
 _SPELL_DAMAGE_PATTERN = re.compile(
-    r"sorts?:\s*(\d+)\s*(?:dgt|DGT|dégâts)\s*(?:imblocables?|de\s+(?:feu|glace))?",
-    re.IGNORECASE,
+    r"sorts?:\s*(\d+)\s*(?:dgt|degats)\s*(?:imblocables?|de\s+(?:feu|glace))?"
 )
 _SPELL_DAMAGE_BONUS_PATTERN = re.compile(
-    r"\+(\d+)\s+(?:au\s+)?dgt\s+des\s+sorts\s+des\s+mages", re.IGNORECASE
-)
-_SPELL_DAMAGE_WITH_KDO_PATTERN = re.compile(
-    r"sorts?:\s*(\d+)\s*dgt\s+de\s+glace\s*\+(\d+)\s*par\s+Kdo", re.IGNORECASE
+    r"\+(\d+)\s+(?:au\s+)?dgt\s+des\s+sorts\s+des\s+mages"
 )
 _MAGIE_CAROTTES_PATTERN = re.compile(
-    r"Magie\s+de\s+carottes\s+(\d+)\s+DGT\s+des\s+sorts", re.IGNORECASE
+    r"magie\s+de\s+carottes\s+(\d+)\s+dgt\s+des\s+sorts"
 )
 
 # Defense multiplier patterns
-_DOUBLE_PV_DEFENSE_PATTERN = re.compile(
-    r"Double\s+ses\s+PV\s+lors\s+des\s+d[ée]fenses", re.IGNORECASE
-)
+_DOUBLE_PV_DEFENSE_PATTERN = re.compile(r"double\s+ses\s+pv\s+lors\s+des\s+defenses")
 
 # ATK/PV tradeoff for class patterns
 _ATK_PV_TRADEOFF_CLASS_PATTERN = re.compile(
-    r"\+(\d+)\s*ATQ\s*/\s*-(\d+)\s*PV\s+pour\s+les\s+(\w+)", re.IGNORECASE
+    r"\+(\d+)\s*atq\s*/\s*-(\d+)\s*pv\s+pour\s+les\s+(\w+)"
 )
 
 # Demon bonus patterns
 _DEMON_IMBLOCABLE_BONUS_PATTERN = re.compile(
-    r"\+(\d+)\s+dgts?\s+imblocable\s+pour\s+le\s+d[ée]mon", re.IGNORECASE
+    r"\+(\d+)\s+dgts?\s+imblocable\s+pour\s+le\s+demon"
 )
 _DEMON_ATK_PV_PATTERN = re.compile(
-    r"\+(\d+)\s*ATQ\s*/\s*-(\d+)\s*PV\s+pour\s+le\s+d[ée]mon", re.IGNORECASE
+    r"\+(\d+)\s*atq\s*/\s*-(\d+)\s*pv\s+pour\s+le\s+demon"
 )
 _DEMONS_GAIN_BONUSES_PATTERN = re.compile(
-    r"[Ll]es\s+[Dd][ée]mons\s+gagnent\s+les\s+bonus\s+comme\s+les\s+autres",
-    re.IGNORECASE,
+    r"les\s+demons\s+gagnent\s+les\s+bonus\s+comme\s+les\s+autres"
 )
 
 # Weapon/Equipment patterns
-_WEAPON_EQUIPPED_BONUS_PATTERN = re.compile(
-    r"\+(\d+)\s*ATQ\s+si\s+[ée]quip[ée]\s+de\s+(?:la\s+)?(\w+(?:\s+\w+)*)",
-    re.IGNORECASE,
-)
 _WEAPON_ATK_IF_NINJA_PATTERN = re.compile(
-    r"[Tt]outes\s+les\s+armes\s+\+(\d+)\s*ATQ\s+si\s+ninja\s+choisi", re.IGNORECASE
+    r"toutes\s+les\s+armes\s+\+(\d+)\s*atq\s+si\s+ninja\s+choisi"
 )
 _WEAPON_ATK_PER_RATON_PATTERN = re.compile(
-    r"\+(\d+)\s*ATQ\s+sur\s+une\s+arme\s+par\s+raton\s+en\s+jeu", re.IGNORECASE
+    r"\+(\d+)\s*atq\s+sur\s+une\s+arme\s+par\s+raton\s+en\s+jeu"
 )
 
 # Kdo (Gift) patterns
-_KDO_PV_BONUS_PATTERN = re.compile(
-    r"\+(\d+)\s*PV\s+par\s+Kdo\s+[ée]quip[ée]\s+sur\s+lui", re.IGNORECASE
-)
+_KDO_PV_BONUS_PATTERN = re.compile(r"\+(\d+)\s*pv\s+par\s+kdo\s+equipe\s+sur\s+lui")
 _KDO_ATK_EXTRA_PATTERN = re.compile(
-    r"[Ll]es\s+Kdo\s+donnent\s+\+(\d+)\s*ATQ\s+suppl[ée]mentaire", re.IGNORECASE
-)
-
-# Sacrifice patterns
-_SACRIFICE_FOR_ITEM_PATTERN = re.compile(
-    r"sacrifier\s+cette\s+carte,?\s+vous\s+gagnez\s+(\w+(?:\s+\w+)*)", re.IGNORECASE
-)
-_SACRIFICE_IF_THRESHOLD_PATTERN = re.compile(
-    r"si\s+(\d+)\s+(\w+),?\s+sacrifier\s+cette\s+carte", re.IGNORECASE
+    r"les\s+kdo\s+donnent\s+\+(\d+)\s*atq\s+supplementaire"
 )
 
 # Imblocable scaling pattern
 _IMBLOCABLE_SCALING_PATTERN = re.compile(
-    r"\+(\d+)\s+dgt\s+imblocable\s+tous\s+les\s+(\d+)\s+dgt\s+imblocables?",
-    re.IGNORECASE,
+    r"\+(\d+)\s+dgt\s+imblocable\s+tous\s+les\s+(\d+)\s+dgt\s+imblocables?"
 )
 
 # Per-turn self-damage pattern
 _PER_TURN_SELF_DAMAGE_PATTERN = re.compile(
-    r"[Vv]ous\s+perdez\s+(\d+)\s+PV\s+(?:imblocables?\s+)?par\s+tour", re.IGNORECASE
+    r"vous\s+perdez\s+(\d+)\s+pv\s+(?:imblocables?\s+)?par\s+tour"
 )
 
 # Enemy high ATK debuff pattern
 _ENEMY_HIGH_ATK_DEBUFF_PATTERN = re.compile(
-    r"-(\d+)\s*ATQ\s+pour\s+le\s+monstre\s+ennemi\s+avec\s+le\s+plus\s+d['']?ATQ",
-    re.IGNORECASE,
+    r"-(\d+)\s*atq\s+pour\s+le\s+monstre\s+ennemi\s+avec\s+le\s+plus\s+d['']?atq",
 )
 
 # Fire vulnerability pattern
-_FIRE_VULNERABILITY_PATTERN = re.compile(
-    r"PV\s*=\s*0\s+si\s+magie\s+de\s+feu", re.IGNORECASE
-)
+_FIRE_VULNERABILITY_PATTERN = re.compile(r"pv\s*=\s*0\s+si\s+magie\s+de\s+feu")
 
 # Reduced monture threshold pattern
 _REDUCED_MONTURE_PATTERN = re.compile(
-    r"il\s+suffit\s+de\s+(\d+)\s+montures?\s+pour\s+activer", re.IGNORECASE
+    r"il\s+suffit\s+de\s+(\d+)\s+montures?\s+pour\s+activer"
 )
 
 # Gold if imblocable pattern
 _GOLD_IF_IMBLOCABLE_PATTERN = re.compile(
-    r"\+(\d+)\s+d['']?or\s+si\s+des?\s+dgt\s+imblocable\s+sont?\s+inflig[ée]s?",
-    re.IGNORECASE,
+    r"\+(\d+)\s+d['']?or\s+si\s+des?\s+dgt\s+imblocable\s+sont?\s+infliges?"
 )
 
 # PV damage from healing pattern
 _PV_DAMAGE_FROM_HEALING_PATTERN = re.compile(
-    r"[Ii]nflige\s+(\d+)\s+DGT\s+par\s+PV\s+rendu\s+ce\s+tour", re.IGNORECASE
+    r"inflige\s+(\d+)\s+dgt\s+par\s+pv\s+rendu\s+ce\s+tour"
 )
 
 # Class threshold bonus pattern (e.g., "+2 ATQ si bonus Archer 2")
 _CLASS_BONUS_THRESHOLD_PATTERN = re.compile(
-    r"\+(\d+)\s*ATQ\s+si\s+bonus\s+(\w+)\s+(\d+)", re.IGNORECASE
+    r"\+(\d+)\s*atq\s+si\s+bonus\s+(\w+)\s+(\d+)"
 )
 
 # Family count threshold pattern (e.g., "+4 ATQ si raccoon familly 2")
 _FAMILY_COUNT_THRESHOLD_PATTERN = re.compile(
-    r"\+(\d+)\s*ATQ\s+(?:si|contre\s+si)\s+(?:raccoon\s+familly|lapins?|ratons?)\s+(\d+)",
-    re.IGNORECASE,
+    r"\+(\d+)\s*atq\s+(?:si|contre\s+si)\s+(raccoon\s+familly|lapins?|ratons?)\s+(\d+)",
 )
 
 # Hall of Win threshold pattern
 _HALL_OF_WIN_THRESHOLD_PATTERN = re.compile(
-    r"\+(\d+)\s*ATQ\s+si\s+Hall\s+of\s+win\s+(\d+)", re.IGNORECASE
+    r"\+(\d+)\s*atq\s+si\s+hall\s+of\s+win\s+(\d+)"
 )
 
 # Cyborg and S-Team combined bonus pattern
 _CYBORG_STEAM_BONUS_PATTERN = re.compile(
-    r"\+(\d+)\s*ATQ\s+pour\s+les\s+cyborgs?\s+et\s+S-Team", re.IGNORECASE
+    r"\+(\d+)\s*atq\s+pour\s+les\s+cyborgs?\s+et\s+s-team"
 )
 
 # Women Atlantide bonus pattern
-_WOMEN_FAMILY_BONUS_PATTERN = re.compile(
-    r"\+(\d+)\s*ATQ\s+pour\s+les\s+femmes\s+(\w+)", re.IGNORECASE
+_WOMEN_FAMILY_BONUS_PATTERN = re.compile(r"\+(\d+)\s*atq\s+pour\s+les\s+femmes\s+(\w+)")
+
+# Every pattern used in resolve_bonus_text_effects, keyed by the field its match
+# is exposed under in _BonusTextMatches. Strict mode uses the same table: if a
+# bonus_text doesn't match ANY of these patterns, it's unrecognized.
+_BONUS_TEXT_PATTERNS: Mapping[str, re.Pattern[str]] = MappingProxyType(
+    {
+        "bonus_for_family": _BONUS_FOR_FAMILY_PATTERN,
+        "bonus_if_threshold": _BONUS_IF_THRESHOLD_PATTERN,
+        "negative_atk_for_class": _NEGATIVE_ATK_FOR_CLASS_PATTERN,
+        "on_attacked_damage": _ON_ATTACKED_DAMAGE_PATTERN,
+        "per_turn_imblocable": _PER_TURN_IMBLOCABLE_PATTERN,
+        "flat_imblocable": _FLAT_IMBLOCABLE_PATTERN,
+        "lifelink": _LIFELINK_PATTERN,
+        "spell_damage_block": _SPELL_DAMAGE_BLOCK_PATTERN,
+        "po_per_turn_if": _PO_PER_TURN_IF_PATTERN,
+        "po_per_ratons": _PO_PER_RATONS_PATTERN,
+        "raccoon_family_bonus": _RACCOON_FAMILY_BONUS_PATTERN,
+        "solo_ninja": _SOLO_NINJA_PATTERN,
+        "bonus_if_joe": _BONUS_IF_JOE_PATTERN,
+        "bonus_if_reine": _BONUS_IF_REINE_PATTERN,
+        "bonus_if_raton_mignon": _BONUS_IF_RATON_MIGNON_PATTERN,
+        "bonus_if_maitre_rat": _BONUS_IF_MAITRE_RAT_PATTERN,
+        "pv_if_maitre_rat": _PV_IF_MAITRE_RAT_PATTERN,
+        "atk_per_enemy_econome": _ATK_PER_ENEMY_ECONOME_PATTERN,
+        "pv_per_turn_if": _PV_PER_TURN_IF_PATTERN,
+        "multi_po_if": _MULTI_PO_IF_PATTERN,
+        "atk_penalty_if_card": _ATK_PENALTY_IF_CARD_PATTERN,
+        "min_atk_floor": _MIN_ATK_FLOOR_PATTERN,
+        "deck_reveal_atk": _DECK_REVEAL_ATK_PATTERN,
+        "deck_reveal_mult": _DECK_REVEAL_MULT_PATTERN,
+        "diplo_combined": _DIPLO_COMBINED_PATTERN,
+        "diplo_cross_atk": _DIPLO_CROSS_ATK_PATTERN,
+        "diplo_cross_pv": _DIPLO_CROSS_PV_PATTERN,
+        "spell_damage": _SPELL_DAMAGE_PATTERN,
+        "spell_damage_bonus": _SPELL_DAMAGE_BONUS_PATTERN,
+        "magie_carottes": _MAGIE_CAROTTES_PATTERN,
+        "double_pv_defense": _DOUBLE_PV_DEFENSE_PATTERN,
+        "atk_pv_tradeoff_class": _ATK_PV_TRADEOFF_CLASS_PATTERN,
+        "demon_imblocable_bonus": _DEMON_IMBLOCABLE_BONUS_PATTERN,
+        "demon_atk_pv": _DEMON_ATK_PV_PATTERN,
+        "demons_gain_bonuses": _DEMONS_GAIN_BONUSES_PATTERN,
+        "weapon_atk_if_ninja": _WEAPON_ATK_IF_NINJA_PATTERN,
+        "weapon_atk_per_raton": _WEAPON_ATK_PER_RATON_PATTERN,
+        "kdo_pv_bonus": _KDO_PV_BONUS_PATTERN,
+        "kdo_atk_extra": _KDO_ATK_EXTRA_PATTERN,
+        "imblocable_scaling": _IMBLOCABLE_SCALING_PATTERN,
+        "per_turn_self_damage": _PER_TURN_SELF_DAMAGE_PATTERN,
+        "enemy_high_atk_debuff": _ENEMY_HIGH_ATK_DEBUFF_PATTERN,
+        "fire_vulnerability": _FIRE_VULNERABILITY_PATTERN,
+        "reduced_monture": _REDUCED_MONTURE_PATTERN,
+        "gold_if_imblocable": _GOLD_IF_IMBLOCABLE_PATTERN,
+        "pv_damage_from_healing": _PV_DAMAGE_FROM_HEALING_PATTERN,
+        "class_bonus_threshold": _CLASS_BONUS_THRESHOLD_PATTERN,
+        "family_count_threshold": _FAMILY_COUNT_THRESHOLD_PATTERN,
+        "hall_of_win_threshold": _HALL_OF_WIN_THRESHOLD_PATTERN,
+        "cyborg_steam_bonus": _CYBORG_STEAM_BONUS_PATTERN,
+        "women_family_bonus": _WOMEN_FAMILY_BONUS_PATTERN,
+        "lapin_board_expansion": _LAPIN_BOARD_EXPANSION_PATTERN,
+        "board_expansion": _BOARD_EXPANSION_PATTERN,
+    }
+)
+_ALL_BONUS_TEXT_PATTERNS: tuple[re.Pattern[str], ...] = tuple(
+    _BONUS_TEXT_PATTERNS.values()
 )
 
-# All patterns used in resolve_bonus_text_effects for strict mode validation.
-# If a bonus_text doesn't match ANY of these patterns, it's unrecognized.
-_ALL_BONUS_TEXT_PATTERNS: tuple[re.Pattern[str], ...] = (
-    _BONUS_FOR_FAMILY_PATTERN,
-    _BONUS_FOR_CLASS_PATTERN,
-    _BONUS_IF_THRESHOLD_PATTERN,
-    _NEGATIVE_ATK_FOR_CLASS_PATTERN,
-    _ON_ATTACKED_DAMAGE_PATTERN,
-    _PER_TURN_IMBLOCABLE_PATTERN,
-    _FLAT_IMBLOCABLE_PATTERN,
-    _LIFELINK_PATTERN,
-    _SPELL_DAMAGE_BLOCK_PATTERN,
-    _PO_PER_TURN_IF_PATTERN,
-    _PO_PER_RATONS_PATTERN,
-    _RACCOON_FAMILY_BONUS_PATTERN,
-    _SOLO_NINJA_PATTERN,
-    _BONUS_IF_JOE_PATTERN,
-    _BONUS_IF_REINE_PATTERN,
-    _BONUS_IF_RATON_MIGNON_PATTERN,
-    _BONUS_IF_MAITRE_RAT_PATTERN,
-    _PV_IF_MAITRE_RAT_PATTERN,
-    _ATK_PER_ENEMY_ECONOME_PATTERN,
-    _PV_PER_TURN_IF_PATTERN,
-    _MULTI_PO_IF_PATTERN,
-    _ATK_PENALTY_IF_CARD_PATTERN,
-    _MIN_ATK_FLOOR_PATTERN,
-    _DECK_REVEAL_ATK_PATTERN,
-    _DECK_REVEAL_MULT_PATTERN,
-    _DIPLO_COMBINED_PATTERN,
-    _DIPLO_CROSS_ATK_PATTERN,
-    _DIPLO_CROSS_PV_PATTERN,
-    _SPELL_DAMAGE_PATTERN,
-    _SPELL_DAMAGE_BONUS_PATTERN,
-    _MAGIE_CAROTTES_PATTERN,
-    _DOUBLE_PV_DEFENSE_PATTERN,
-    _ATK_PV_TRADEOFF_CLASS_PATTERN,
-    _DEMON_IMBLOCABLE_BONUS_PATTERN,
-    _DEMON_ATK_PV_PATTERN,
-    _DEMONS_GAIN_BONUSES_PATTERN,
-    _WEAPON_ATK_IF_NINJA_PATTERN,
-    _WEAPON_ATK_PER_RATON_PATTERN,
-    _KDO_PV_BONUS_PATTERN,
-    _KDO_ATK_EXTRA_PATTERN,
-    _IMBLOCABLE_SCALING_PATTERN,
-    _PER_TURN_SELF_DAMAGE_PATTERN,
-    _ENEMY_HIGH_ATK_DEBUFF_PATTERN,
-    _FIRE_VULNERABILITY_PATTERN,
-    _REDUCED_MONTURE_PATTERN,
-    _GOLD_IF_IMBLOCABLE_PATTERN,
-    _PV_DAMAGE_FROM_HEALING_PATTERN,
-    _CLASS_BONUS_THRESHOLD_PATTERN,
-    _FAMILY_COUNT_THRESHOLD_PATTERN,
-    _HALL_OF_WIN_THRESHOLD_PATTERN,
-    _CYBORG_STEAM_BONUS_PATTERN,
-    _WOMEN_FAMILY_BONUS_PATTERN,
-    _LAPIN_BOARD_EXPANSION_PATTERN,
-    _BOARD_EXPANSION_PATTERN,
+# Result of searching one normalised bonus_text with every pattern above: one
+# field per _BONUS_TEXT_PATTERNS key, holding the match or None.
+_BonusTextMatches = namedtuple("_BonusTextMatches", _BONUS_TEXT_PATTERNS)
+
+# French target names used in ability effect text, built once at import time.
+# Each table mirrors the names its resolver has always recognised; keys are in
+# the normalised form produced by _normalize_text (lower case, no accents).
+
+# "pour les <classe>" targets in scaling effects; None means all monsters.
+_EFFECT_TARGET_CLASSES: Mapping[str, CardClass | None] = MappingProxyType(
+    {
+        "combattants": CardClass.COMBATTANT,
+        "combattant": CardClass.COMBATTANT,
+        "defenseurs": CardClass.DEFENSEUR,
+        "defenseur": CardClass.DEFENSEUR,
+        "mages": CardClass.MAGE,
+        "mage": CardClass.MAGE,
+        "archers": CardClass.ARCHER,
+        "archer": CardClass.ARCHER,
+        "dragons": CardClass.DRAGON,
+        "dragon": CardClass.DRAGON,
+        "monstres": None,  # All monsters
+    }
 )
 
+# "pour tous les <famille>" targets in family scaling effects.
+_SCALING_TARGET_FAMILIES: Mapping[str, Family] = MappingProxyType(
+    {
+        "lapins": Family.LAPIN,
+        "lapin": Family.LAPIN,
+        "cyborgs": Family.CYBORG,
+        "cyborg": Family.CYBORG,
+        "atlantides": Family.ATLANTIDE,
+        "atlantide": Family.ATLANTIDE,
+        "natures": Family.NATURE,
+        "nature": Family.NATURE,
+        "neiges": Family.NEIGE,
+        "neige": Family.NEIGE,
+        "ratons": Family.RATON,
+        "raton": Family.RATON,
+    }
+)
 
-def _bonus_text_matches_any_pattern(bonus_text: str) -> bool:
-    """Check if bonus_text matches any known pattern.
+# Per-card and "aux <famille>" targets in Dragon conditional effects.
+_CONDITIONAL_TARGET_FAMILIES: Mapping[str, Family] = MappingProxyType(
+    {
+        "raton": Family.RATON,
+        "ratons": Family.RATON,
+        "lapin": Family.LAPIN,
+        "lapins": Family.LAPIN,
+        "cyborg": Family.CYBORG,
+        "cyborgs": Family.CYBORG,
+        "nature": Family.NATURE,
+        "atlantide": Family.ATLANTIDE,
+        "ninja": Family.NINJA,
+        "ninjas": Family.NINJA,
+        "neige": Family.NEIGE,
+    }
+)
+
+# Family targets named in bonus_text ("+2 ATQ pour les ninjas", ...).
+_BONUS_TARGET_FAMILIES: Mapping[str, Family] = MappingProxyType(
+    {
+        "cyborg": Family.CYBORG,
+        "cyborgs": Family.CYBORG,
+        "nature": Family.NATURE,
+        "atlantide": Family.ATLANTIDE,
+        "ninja": Family.NINJA,
+        "ninjas": Family.NINJA,
+        "neige": Family.NEIGE,
+        "lapin": Family.LAPIN,
+        "lapins": Family.LAPIN,
+        "raton": Family.RATON,
+        "ratons": Family.RATON,
+        "raccoon": Family.RATON,
+        "hall": Family.HALL_OF_WIN,
+    }
+)
+
+# Diplo partners named in Diplo synergy bonuses, with the card names
+# (normalised) that provide them.
+_DIPLO_PARTNER_NAMES: tuple[tuple[str, ...], ...] = (
+    ("terre", "diplo-terre", "diplo terre"),
+    ("air", "diplo-air", "diplo air"),
+    ("mer", "diplo-mer", "diplo mer"),
+)
+
+# Class targets named in bonus_text ("-1 ATQ pour les mages", ...).
+_BONUS_TARGET_CLASSES: Mapping[str, CardClass] = MappingProxyType(
+    {
+        "combattants": CardClass.COMBATTANT,
+        "combattant": CardClass.COMBATTANT,
+        "defenseurs": CardClass.DEFENSEUR,
+        "defenseur": CardClass.DEFENSEUR,
+        "mages": CardClass.MAGE,
+        "mage": CardClass.MAGE,
+        "archers": CardClass.ARCHER,
+        "archer": CardClass.ARCHER,
+        "dragons": CardClass.DRAGON,
+        "dragon": CardClass.DRAGON,
+        "s-team": CardClass.S_TEAM,
+        "econome": CardClass.ECONOME,
+        "economes": CardClass.ECONOME,
+    }
+)
+
+
+@cache
+def _normalize_text(text: str) -> str:
+    """Normalise card text for pattern matching.
+
+    Lower-cases the text and strips accents (see normalize_to_ascii) so it can
+    be matched by the module's lower-case, accent-free patterns. Card texts
+    come from a fixed database, so results are cached by text.
+
+    Args:
+        text: Raw card, ability or bonus text.
+
+    Returns:
+        The normalised text.
+    """
+    return normalize_to_ascii(text)
+
+
+@cache
+def _match_bonus_text(bonus_lower: str) -> _BonusTextMatches:
+    """Search a normalised bonus_text with every known bonus_text pattern.
+
+    A card's bonus_text is fixed, so the outcome of each search is the same on
+    every resolution. Running all patterns once per distinct text and caching
+    the matches turns the resolver's pattern checks into attribute lookups.
+
+    Args:
+        bonus_lower: Bonus text as returned by _normalize_text.
+
+    Returns:
+        The match (or None) of each pattern in _BONUS_TEXT_PATTERNS.
+    """
+    return _BonusTextMatches._make(
+        [pattern.search(bonus_lower) for pattern in _ALL_BONUS_TEXT_PATTERNS]
+    )
+
+
+_CARD_FAMILY = attrgetter("family")
+
+
+def _board_counts(player: PlayerState) -> BoardCounts:
+    """Get class and family counts for a player's board, memoized per board.
+
+    Ability resolution runs several times per turn (combat, per-turn effects,
+    AI evaluation) on boards that rarely change in between. The counts are
+    cached on the player and reused while the board holds the same card
+    objects in the same order. The returned counters are shared and must not
+    be mutated.
 
     Args:
-        bonus_text: The bonus_text to check.
+        player: The player whose board to count.
 
     Returns:
-        True if any pattern matches, False otherwise.
+        Tuple of (non-demon cards per class, all cards per family, first
+        non-demon card of each class).
     """
-    for pattern in _ALL_BONUS_TEXT_PATTERNS:
-        if pattern.search(bonus_text):
-            return True
-    return False
+    board = player.board
+    cached = player._board_cache
+    if cached is not None:
+        snapshot, counts = cached
+        if len(snapshot) == len(board) and all(map(is_, snapshot, board)):
+            return counts
+
+    # Counter counts an iterable in C, so extract each column and count it in
+    # bulk instead of incrementing per card.
+    # Demons may have restrictions
+    non_demons = [card for card in board if card.card_type != CardType.DEMON]
+    classes = [card.card_class for card in non_demons]
+    class_counter: Counter[CardClass] = Counter(classes)
+    family_counter: Counter[Family] = Counter(map(_CARD_FAMILY, board))
+    # Built back to front so the first card of each class wins.
+    first_by_class = dict(zip(reversed(classes), reversed(non_demons)))
+
+    counts: BoardCounts = (class_counter, family_counter, first_by_class)
+    player._board_cache = (tuple(board), counts)
+    return counts
 
 
 def count_cards_by_class(player: PlayerState) -> Counter[CardClass]:
@@ -653,11 +829,7 @@ def count_cards_by_class(player: PlayerState) -> Counter[CardClass]:
     Returns:
         Counter mapping CardClass to count.
     """
-    counter: Counter[CardClass] = Counter()
-    for card in player.board:
-        if card.card_type != CardType.DEMON:  # Demons may have restrictions
-            counter[card.card_class] += 1
-    return counter
+    return Counter(_board_counts(player)[0])
 
 
 def count_cards_by_family(player: PlayerState) -> Counter[Family]:
@@ -669,12 +841,10 @@ def count_cards_by_family(player: PlayerState) -> Counter[Family]:
     Returns:
         Counter mapping Family to count.
     """
-    counter: Counter[Family] = Counter()
-    for card in player.board:
-        counter[card.family] += 1
-    return counter
+    return Counter(_board_counts(player)[1])
 
 
+@cache
 def parse_ability_effect(effect_text: str) -> AbilityEffect:
     """Parse an ability effect string into structured data.
 
@@ -684,67 +854,90 @@ def parse_ability_effect(effect_text: str) -> AbilityEffect:
     - "+2 PV pour les défenseurs" (health bonus for class)
     - "+4 dgt si 2 défenseurs" (conditional attack bonus)
 
+    Parsing is pure, so results are cached by effect text: the card database
+    only contains a small, fixed set of effect strings that recur every turn,
+    so after the first sighting of each string the regex scan is skipped
+    entirely. The returned AbilityEffect is frozen and shared between callers.
+
     Args:
         effect_text: The effect description to parse.
 
     Returns:
         AbilityEffect with parsed values.
     """
-    effect = AbilityEffect(description=effect_text)
+    # Single scan over the text; keep the first (leftmost) match of each kind
+    matches: dict[str, re.Match[str]] = {}
+    for fragment in _EFFECT_SCAN_PATTERN.finditer(_normalize_text(effect_text)):
+        kind = fragment.lastgroup
+        if kind is not None and kind not in matches:
+            matches[kind] = fragment
+
+    attack_bonus = 0
+    health_bonus = 0
+    self_damage = 0
+    imblocable_damage = 0
+    target = AbilityTarget.SELF
+    target_class: CardClass | None = None
 
     # Parse attack bonus
-    atk_match = _ATK_PATTERN.search(effect_text)
-    if atk_match:
-        effect.attack_bonus = int(atk_match.group(1))
+    if "atk" in matches:
+        attack_bonus = int(matches["atk"].group("atk_value"))
 
     # Parse health bonus
-    pv_match = _PV_PATTERN.search(effect_text)
-    if pv_match:
-        effect.health_bonus = int(pv_match.group(1))
+    if "pv" in matches:
+        health_bonus = int(matches["pv"].group("pv_value"))
 
     # Parse self-damage (negative PV like "-2 PV")
-    self_dmg_match = _SELF_DAMAGE_PATTERN.search(effect_text)
-    if self_dmg_match:
-        effect.self_damage = int(self_dmg_match.group(1))
+    if "self_damage" in matches:
+        self_damage = int(matches["self_damage"].group("self_damage_value"))
 
     # Parse imblocable damage
-    imb_match = _IMBLOCABLE_PATTERN.search(effect_text)
-    if imb_match:
-        effect.imblocable_damage = int(imb_match.group(1))
+    if "imblocable" in matches:
+        imblocable_damage = int(matches["imblocable"].group("imblocable_value"))
 
     # Parse target (for class-specific bonuses)
-    for_match = _FOR_CLASS_PATTERN.search(effect_text)
-    if for_match:
-        target_name = for_match.group(1).lower()
-        # Map common French names to CardClass
-        class_map = {
-            "combattants": CardClass.COMBATTANT,
-            "combattant": CardClass.COMBATTANT,
-            "défenseurs": CardClass.DEFENSEUR,
-            "defenseurs": CardClass.DEFENSEUR,
-            "défenseur": CardClass.DEFENSEUR,
-            "defenseur": CardClass.DEFENSEUR,
-            "mages": CardClass.MAGE,
-            "mage": CardClass.MAGE,
-            "archers": CardClass.ARCHER,
-            "archer": CardClass.ARCHER,
-            "dragons": CardClass.DRAGON,
-            "dragon": CardClass.DRAGON,
-            "monstres": None,  # All monsters
-        }
-        if target_name in class_map:
-            if class_map[target_name] is None:
-                effect.target = AbilityTarget.ALL_MONSTERS
+    if "for_class" in matches:
+        target_name = matches["for_class"].group("for_class_value")
+        if target_name in _EFFECT_TARGET_CLASSES:
+            target_class = _EFFECT_TARGET_CLASSES[target_name]
+            if target_class is None:
+                target = AbilityTarget.ALL_MONSTERS
             else:
-                effect.target = AbilityTarget.SPECIFIC
-                effect.target_class = class_map[target_name]
+                target = AbilityTarget.SPECIFIC
 
     # Check for conditional on defenders
-    if _IF_DEFENDERS_PATTERN.search(effect_text):
-        effect.target = AbilityTarget.SPECIFIC
-        effect.target_class = CardClass.DEFENSEUR
+    if "if_defenders" in matches:
+        target = AbilityTarget.SPECIFIC
+        target_class = CardClass.DEFENSEUR
+
+    return AbilityEffect(
+        attack_bonus=attack_bonus,
+        health_bonus=health_bonus,
+        self_damage=self_damage,
+        imblocable_damage=imblocable_damage,
+        target=target,
+        target_class=target_class,
+        description=effect_text,
+    )
 
-    return effect
+
+@cache
+def _scaling_target_family(effect_text: str) -> Family | None:
+    """Get the family targeted by a "pour tous les [family]" scaling effect.
+
+    Depends only on the effect text, so it is resolved once per distinct
+    effect instead of once per card per resolution.
+
+    Args:
+        effect_text: The scaling effect description.
+
+    Returns:
+        The targeted Family, or None if the effect has no known family target.
+    """
+    for_all_match = _FOR_ALL_FAMILY_PATTERN.search(_normalize_text(effect_text))
+    if not for_all_match:
+        return None
+    return _SCALING_TARGET_FAMILIES.get(for_all_match.group(1))
 
 
 def get_active_scaling_ability(
@@ -754,7 +947,8 @@ def get_active_scaling_ability(
     """Get the highest active scaling ability for a given count.
 
     Scaling abilities activate at thresholds (e.g., 2, 4, 6 cards).
-    Only the highest threshold that is met applies.
+    Only the highest threshold that is met applies; the list does not need to
+    be sorted, and on equal thresholds the first ability wins.
 
     Args:
         abilities: List of scaling abilities to check.
@@ -763,6 +957,8 @@ def get_active_scaling_ability(
     Returns:
         The highest applicable ScalingAbility, or None if none apply.
     """
+    # Cards carry at most a handful of tiers, so a single pass is cheaper than
+    # any presorted or compiled lookup structure would be to build or consult.
     active = None
     for ability in abilities:
         if count >= ability.threshold:
@@ -783,65 +979,75 @@ def resolve_class_abilities(player: PlayerState) -> AbilityResolutionResult:
     Returns:
         AbilityResolutionResult with all bonuses and effects.
     """
-    result = AbilityResolutionResult()
-    class_counts = count_cards_by_class(player)
-    result.class_counts = dict(class_counts)
+    class_counts = _board_counts(player)[0]
+
+    # Accumulate in locals and build the result once at the end
+    attack_bonus = 0
+    health_bonus = 0
+    self_damage = 0
+    imblocable_bonus = 0
+    effects: list[AbilityEffect] = []
 
     # Track which classes we've already processed (avoid double-counting)
-    processed_effects: set[str] = set()
+    processed_effects: set[tuple[CardClass, int, str]] = set()
+
+    # Loop invariants bound to locals
+    demon = CardType.DEMON
+    class_count_of = class_counts.get
 
     for card in player.board:
-        if card.card_type == CardType.DEMON:
+        # Most cheaply rejected first: cards without class scaling abilities
+        scaling = card.class_abilities.scaling
+        if not scaling:
+            continue
+        if card.card_type is demon:
             continue  # Demons have restrictions on bonuses
 
         card_class = card.card_class
-        class_count = class_counts[card_class]
 
         # Get the active scaling ability for this class
-        if card.class_abilities.scaling:
-            active = get_active_scaling_ability(
-                card.class_abilities.scaling,
-                class_count,
-            )
-
-            if active:
-                # Create a unique key to avoid processing same ability multiple times
-                effect_key = f"{card_class.value}_{active.threshold}_{active.effect}"
-
-                if effect_key not in processed_effects:
-                    processed_effects.add(effect_key)
-                    effect = parse_ability_effect(active.effect)
-
-                    # Apply the effect based on target
-                    if effect.target == AbilityTarget.SELF:
-                        # Effect applies once for the class
-                        result.total_attack_bonus += effect.attack_bonus
-                        result.total_health_bonus += effect.health_bonus
-                        result.total_self_damage += effect.self_damage
-                        result.total_imblocable_bonus += effect.imblocable_damage
-                    elif effect.target == AbilityTarget.SPECIFIC:
-                        # Effect applies per matching card
-                        if effect.target_class:
-                            target_count = class_counts.get(effect.target_class, 0)
-                            result.total_attack_bonus += (
-                                effect.attack_bonus * target_count
-                            )
-                            result.total_health_bonus += (
-                                effect.health_bonus * target_count
-                            )
-                    elif effect.target == AbilityTarget.ALL_MONSTERS:
-                        # Effect applies to all monsters
-                        total_monsters = sum(class_counts.values())
-                        result.total_attack_bonus += (
-                            effect.attack_bonus * total_monsters
-                        )
-                        result.total_health_bonus += (
-                            effect.health_bonus * total_monsters
-                        )
-
-                    result.effects.append(effect)
+        active = get_active_scaling_ability(scaling, class_counts[card_class])
+        if not active:
+            continue  # No threshold met
 
-    return result
+        # Create a unique key to avoid processing same ability multiple times
+        effect_text = active.effect
+        effect_key = (card_class, active.threshold, effect_text)
+        if effect_key in processed_effects:
+            continue
+        processed_effects.add(effect_key)
+        effect = parse_ability_effect(effect_text)
+
+        # Apply the effect based on target
+        target = effect.target
+        if target is AbilityTarget.SELF:
+            # Effect applies once for the class
+            attack_bonus += effect.attack_bonus
+            health_bonus += effect.health_bonus
+            self_damage += effect.self_damage
+            imblocable_bonus += effect.imblocable_damage
+        elif target is AbilityTarget.SPECIFIC:
+            # Effect applies per matching card
+            if effect.target_class:
+                target_count = class_count_of(effect.target_class, 0)
+                attack_bonus += effect.attack_bonus * target_count
+                health_bonus += effect.health_bonus * target_count
+        elif target is AbilityTarget.ALL_MONSTERS:
+            # Effect applies to all monsters
+            total_monsters = sum(class_counts.values())
+            attack_bonus += effect.attack_bonus * total_monsters
+            health_bonus += effect.health_bonus * total_monsters
+
+        effects.append(effect)
+
+    return AbilityResolutionResult(
+        total_attack_bonus=attack_bonus,
+        total_health_bonus=health_bonus,
+        total_self_damage=self_damage,
+        total_imblocable_bonus=imblocable_bonus,
+        effects=effects,
+        class_counts=dict(class_counts),
+    )
 
 
 def resolve_family_abilities(player: PlayerState) -> AbilityResolutionResult:
@@ -856,78 +1062,57 @@ def resolve_family_abilities(player: PlayerState) -> AbilityResolutionResult:
     Returns:
         AbilityResolutionResult with all bonuses and effects.
     """
-    result = AbilityResolutionResult()
-    family_counts = count_cards_by_family(player)
+    family_counts = _board_counts(player)[1]
 
-    # Map French family names to Family enum
-    family_name_map: dict[str, Family] = {
-        "lapins": Family.LAPIN,
-        "lapin": Family.LAPIN,
-        "cyborgs": Family.CYBORG,
-        "cyborg": Family.CYBORG,
-        "atlantides": Family.ATLANTIDE,
-        "atlantide": Family.ATLANTIDE,
-        "natures": Family.NATURE,
-        "nature": Family.NATURE,
-        "neiges": Family.NEIGE,
-        "neige": Family.NEIGE,
-        "ratons": Family.RATON,
-        "raton": Family.RATON,
-    }
+    # Accumulate in locals and build the result once at the end
+    attack_bonus = 0
+    health_bonus = 0
+    imblocable_bonus = 0
+    effects: list[AbilityEffect] = []
 
     # Track processed effects
-    processed_effects: set[str] = set()
+    processed_effects: set[tuple[Family, int, str]] = set()
 
     for card in player.board:
-        family = card.family
-        family_count = family_counts[family]
-
-        if card.family_abilities.scaling:
-            active = get_active_scaling_ability(
-                card.family_abilities.scaling,
-                family_count,
-            )
+        scaling = card.family_abilities.scaling
+        if not scaling:
+            continue
 
-            if active:
-                effect_key = f"{family.value}_{active.threshold}_{active.effect}"
-
-                if effect_key not in processed_effects:
-                    processed_effects.add(effect_key)
-                    effect = parse_ability_effect(active.effect)
-
-                    # Check if effect targets "tous les [family]"
-                    # e.g., "+2 ATQ pour tous les lapins" multiplies by count
-                    for_all_match = _FOR_ALL_FAMILY_PATTERN.search(active.effect)
-                    if for_all_match:
-                        target_family_name = for_all_match.group(1).lower()
-                        target_family = family_name_map.get(target_family_name)
-
-                        if target_family and target_family in family_counts:
-                            # Multiply bonus by number of target family cards
-                            target_count = family_counts[target_family]
-                            result.total_attack_bonus += (
-                                effect.attack_bonus * target_count
-                            )
-                            result.total_health_bonus += (
-                                effect.health_bonus * target_count
-                            )
-                            result.total_imblocable_bonus += (
-                                effect.imblocable_damage * target_count
-                            )
-                        else:
-                            # Unknown family, apply once
-                            result.total_attack_bonus += effect.attack_bonus
-                            result.total_health_bonus += effect.health_bonus
-                            result.total_imblocable_bonus += effect.imblocable_damage
-                    else:
-                        # No "pour tous les X" - apply once
-                        result.total_attack_bonus += effect.attack_bonus
-                        result.total_health_bonus += effect.health_bonus
-                        result.total_imblocable_bonus += effect.imblocable_damage
-
-                    result.effects.append(effect)
+        family = card.family
+        active = get_active_scaling_ability(scaling, family_counts[family])
+        if not active:
+            continue  # No threshold met
 
-    return result
+        effect_text = active.effect
+        effect_key = (family, active.threshold, effect_text)
+        if effect_key in processed_effects:
+            continue
+        processed_effects.add(effect_key)
+        effect = parse_ability_effect(effect_text)
+
+        # Check if effect targets "tous les [family]"
+        # e.g., "+2 ATQ pour tous les lapins" multiplies by count
+        target_family = _scaling_target_family(effect_text)
+        if target_family and target_family in family_counts:
+            # Multiply bonus by number of target family cards
+            target_count = family_counts[target_family]
+            attack_bonus += effect.attack_bonus * target_count
+            health_bonus += effect.health_bonus * target_count
+            imblocable_bonus += effect.imblocable_damage * target_count
+        else:
+            # No known "pour tous les X" target - apply once
+            attack_bonus += effect.attack_bonus
+            health_bonus += effect.health_bonus
+            imblocable_bonus += effect.imblocable_damage
+
+        effects.append(effect)
+
+    return AbilityResolutionResult(
+        total_attack_bonus=attack_bonus,
+        total_health_bonus=health_bonus,
+        total_imblocable_bonus=imblocable_bonus,
+        effects=effects,
+    )
 
 
 def resolve_all_abilities(player: PlayerState) -> AbilityResolutionResult:
@@ -939,26 +1124,137 @@ def resolve_all_abilities(player: PlayerState) -> AbilityResolutionResult:
     Returns:
         Combined AbilityResolutionResult.
     """
-    class_result = resolve_class_abilities(player)
+    # Both results are built fresh for this call, so fold the family result
+    # into the class result instead of allocating a third one.
+    combined = resolve_class_abilities(player)
     family_result = resolve_family_abilities(player)
 
-    # Combine results
-    combined = AbilityResolutionResult(
-        total_attack_bonus=class_result.total_attack_bonus
-        + family_result.total_attack_bonus,
-        total_health_bonus=class_result.total_health_bonus
-        + family_result.total_health_bonus,
-        total_self_damage=class_result.total_self_damage
-        + family_result.total_self_damage,
-        total_imblocable_bonus=class_result.total_imblocable_bonus
-        + family_result.total_imblocable_bonus,
-        effects=class_result.effects + family_result.effects,
-        class_counts=class_result.class_counts,
-    )
+    combined.total_attack_bonus += family_result.total_attack_bonus
+    combined.total_health_bonus += family_result.total_health_bonus
+    combined.total_self_damage += family_result.total_self_damage
+    combined.total_imblocable_bonus += family_result.total_imblocable_bonus
+    combined.effects.extend(family_result.effects)
 
     return combined
 
 
+@cache
+def parse_conditional_effect(effect_text: str) -> ConditionalEffect:
+    """Parse a conditional ability effect string into structured data.
+
+    Handles patterns like:
+    - "double son attaque" (attack multiplier)
+    - "2 dgt imblocable" (imblocable damage)
+    - "+3 ATQ" / "+2 PV" (flat bonuses)
+    - "+1 ATQ par raton" (bonus per family member)
+    - "+3 ATQ aux dragons" (bonus per class or family member)
+
+    Like parse_ability_effect, results are cached by effect text and the
+    returned ConditionalEffect is frozen and shared between callers.
+
+    Args:
+        effect_text: The effect description to parse.
+
+    Returns:
+        ConditionalEffect with parsed values.
+    """
+    # Single scan over the text; keep the first (leftmost) match of each kind.
+    # Per-card and class bonuses are also attack bonuses.
+    matches: dict[str, re.Match[str]] = {}
+    for fragment in _DRAGON_EFFECT_SCAN_PATTERN.finditer(_normalize_text(effect_text)):
+        kind = fragment.lastgroup
+        if kind is None:
+            continue
+        matches.setdefault(kind, fragment)
+        if kind == "per_card" or kind == "to_class":
+            matches.setdefault("atk", fragment)
+
+    attack_multiplier = 1
+    imblocable_damage = 0
+    attack_bonus = 0
+    health_bonus = 0
+    per_card_bonus = 0
+    per_card_family: Family | None = None
+    to_class_bonus = 0
+    to_class_target: CardClass | Family | None = None
+    applies = False
+
+    # Parse attack multiplier
+    if "multiplier" in matches:
+        value = matches["multiplier"].group("multiplier_value")
+        attack_multiplier = _ATTACK_MULTIPLIERS[value]
+        applies = True
+
+    # Parse imblocable damage
+    if "imblocable" in matches:
+        imblocable_damage = int(matches["imblocable"].group("imblocable_value"))
+        applies = True
+
+    # Parse attack bonus (the fragment may be a per-card or class one)
+    if "atk" in matches:
+        atk_match = matches["atk"]
+        attack_bonus = int(atk_match.group(f"{atk_match.lastgroup}_value"))
+        applies = True
+
+    # Parse health bonus
+    if "pv" in matches:
+        health_bonus = int(matches["pv"].group("pv_value"))
+        applies = True
+
+    # Parse per-card bonus (e.g., "+1 ATQ par raton")
+    if "per_card" in matches:
+        per_card_match = matches["per_card"]
+        per_card_family = _CONDITIONAL_TARGET_FAMILIES.get(
+            per_card_match.group("per_card_target")
+        )
+        if per_card_family:
+            per_card_bonus = int(per_card_match.group("per_card_value"))
+            applies = True
+
+    # Parse class/family bonus (e.g., "+3 ATQ aux dragons")
+    if "to_class" in matches:
+        to_class_match = matches["to_class"]
+        target_name = to_class_match.group("to_class_target")
+        if target_name in ("dragons", "dragon"):
+            to_class_target = CardClass.DRAGON
+        else:
+            to_class_target = _CONDITIONAL_TARGET_FAMILIES.get(target_name)
+        if to_class_target is not None:
+            to_class_bonus = int(to_class_match.group("to_class_value"))
+            applies = True
+
+    return ConditionalEffect(
+        attack_multiplier=attack_multiplier,
+        imblocable_damage=imblocable_damage,
+        attack_bonus=attack_bonus,
+        health_bonus=health_bonus,
+        per_card_bonus=per_card_bonus,
+        per_card_family=per_card_family,
+        to_class_bonus=to_class_bonus,
+        to_class_target=to_class_target,
+        applies=applies,
+    )
+
+
+@cache
+def _conditional_po_cost(condition: str) -> int | None:
+    """Get the PO cost of a conditional ability condition (e.g., "2 PO").
+
+    Depends only on the condition text, so it is parsed once per distinct
+    condition instead of once per Dragon per resolution.
+
+    Args:
+        condition: The conditional ability's condition text.
+
+    Returns:
+        The PO cost, or None if the condition is not a PO cost.
+    """
+    match = _PO_CONDITION_PATTERN.search(_normalize_text(condition))
+    if not match:
+        return None
+    return int(match.group(1))
+
+
 def resolve_conditional_abilities(
     player: PlayerState,
     po_to_spend: int | None = None,
@@ -989,26 +1285,11 @@ def resolve_conditional_abilities(
     if po_to_spend is None or po_to_spend <= 0:
         return result
 
-    # Count cards by family for per-card bonuses
-    family_counts: dict[Family, int] = {}
-    for c in player.board:
-        if c.card_type != CardType.DEMON:
-            family_counts[c.family] = family_counts.get(c.family, 0) + 1
-
-    # Map family names (French) to Family enum
-    family_name_map = {
-        "raton": Family.RATON,
-        "ratons": Family.RATON,
-        "lapin": Family.LAPIN,
-        "lapins": Family.LAPIN,
-        "cyborg": Family.CYBORG,
-        "cyborgs": Family.CYBORG,
-        "nature": Family.NATURE,
-        "atlantide": Family.ATLANTIDE,
-        "ninja": Family.NINJA,
-        "ninjas": Family.NINJA,
-        "neige": Family.NEIGE,
-    }
+    # Shared board counts for per-card bonuses. Only demons belong to the
+    # Demon family, which no effect targets, so family counts need no filter.
+    class_counts, family_counts, _ = _board_counts(player)
+    if not class_counts[CardClass.DRAGON]:
+        return result  # No Dragon to spend PO on
 
     # Find all Dragon cards with conditional abilities
     for card in player.board:
@@ -1024,90 +1305,43 @@ def resolve_conditional_abilities(
         # OQ007: HIGHEST-WINS logic - only apply abilities at the exact PO tier
         # Find ability that matches the specified PO spend exactly
         matching_ability: ConditionalAbility | None = None
-        matching_cost = 0
         for ability in conditionals:
-            match = _PO_CONDITION_PATTERN.search(ability.condition)
-            if match:
-                po_cost = int(match.group(1))
-                if po_cost == po_to_spend:
-                    matching_ability = ability
-                    matching_cost = po_cost
-                    break
+            if _conditional_po_cost(ability.condition) == po_to_spend:
+                matching_ability = ability
+                break
 
         # If no exact match, no ability activates (highest-wins, not cumulative)
         if matching_ability is None:
             continue
 
         # Apply only the matching ability
-        for po_cost, ability in [(matching_cost, matching_ability)]:
-            effect = ability.effect
-            effect_applied = False
-
-            # Check for attack multiplier
-            if _QUADRUPLE_ATTACK_PATTERN.search(effect):
-                result.attack_multiplier = max(result.attack_multiplier, 4)
-                effect_applied = True
-            elif _TRIPLE_ATTACK_PATTERN.search(effect):
-                result.attack_multiplier = max(result.attack_multiplier, 3)
-                effect_applied = True
-            elif _DOUBLE_ATTACK_PATTERN.search(effect):
-                result.attack_multiplier = max(result.attack_multiplier, 2)
-                effect_applied = True
-
-            # Check for imblocable damage
-            imblocable_match = _IMBLOCABLE_PATTERN.search(effect)
-            if imblocable_match:
-                result.total_imblocable_damage += int(imblocable_match.group(1))
-                effect_applied = True
-
-            # Check for attack bonus
-            atk_match = _ATK_PATTERN.search(effect)
-            if atk_match:
-                result.total_attack_bonus += int(atk_match.group(1))
-                effect_applied = True
-
-            # Check for health bonus
-            pv_match = _PV_PATTERN.search(effect)
-            if pv_match:
-                result.total_health_bonus += int(pv_match.group(1))
-                effect_applied = True
-
-            # Check for per-card bonus (e.g., "+1 ATQ par raton")
-            per_card_match = _PER_CARD_BONUS_PATTERN.search(effect)
-            if per_card_match:
-                bonus_per = int(per_card_match.group(1))
-                family_name = per_card_match.group(2).lower()
-                target_family = family_name_map.get(family_name)
-                if target_family:
-                    count = family_counts.get(target_family, 0)
-                    result.total_attack_bonus += bonus_per * count
-                    effect_applied = True
-
-            # Check for class/family bonus (e.g., "+3 ATQ aux dragons")
-            to_class_match = _BONUS_TO_CLASS_PATTERN.search(effect)
-            if to_class_match:
-                bonus = int(to_class_match.group(1))
-                target_name = to_class_match.group(2).lower()
-                # Count matching cards
-                if target_name in ("dragons", "dragon"):
-                    dragon_count = sum(
-                        1
-                        for c in player.board
-                        if c.card_class == CardClass.DRAGON
-                        and c.card_type != CardType.DEMON
-                    )
-                    result.total_attack_bonus += bonus * dragon_count
-                    effect_applied = True
-                elif target_name in family_name_map:
-                    target_family = family_name_map[target_name]
-                    count = family_counts.get(target_family, 0)
-                    result.total_attack_bonus += bonus * count
-                    effect_applied = True
-
-            if effect_applied:
-                result.effects.append(f"{card.name}: {effect} ({po_cost} PO)")
-                # OQ006: Track exact PO spent (one tier per dragon)
-                result.po_spent += po_cost
+        effect = matching_ability.effect
+        parsed = parse_conditional_effect(effect)
+
+        if parsed.attack_multiplier > result.attack_multiplier:
+            result.attack_multiplier = parsed.attack_multiplier
+        result.total_imblocable_damage += parsed.imblocable_damage
+        result.total_attack_bonus += parsed.attack_bonus
+        result.total_health_bonus += parsed.health_bonus
+
+        # Per-card bonus (e.g., "+1 ATQ par raton")
+        if parsed.per_card_family is not None:
+            count = family_counts[parsed.per_card_family]
+            result.total_attack_bonus += parsed.per_card_bonus * count
+
+        # Class/family bonus (e.g., "+3 ATQ aux dragons")
+        to_class_target = parsed.to_class_target
+        if to_class_target is CardClass.DRAGON:
+            count = class_counts[CardClass.DRAGON]
+            result.total_attack_bonus += parsed.to_class_bonus * count
+        elif to_class_target is not None:
+            count = family_counts[to_class_target]
+            result.total_attack_bonus += parsed.to_class_bonus * count
+
+        if parsed.applies:
+            result.effects.append(f"{card.name}: {effect} ({po_to_spend} PO)")
+            # OQ006: Track exact PO spent (one tier per dragon)
+            result.po_spent += po_to_spend
 
     return result
 
@@ -1125,10 +1359,33 @@ def resolve_passive_abilities(player: PlayerState) -> PassiveAbilityResult:
     Returns:
         PassiveAbilityResult with all passive effects.
     """
+    return _resolve_passives_and_count(player)[0]
+
+
+def _resolve_passives_and_count(
+    player: PlayerState,
+) -> tuple[PassiveAbilityResult, int]:
+    """Resolve passive abilities and count board monsters in one board pass.
+
+    Backs both resolve_passive_abilities and count_board_monsters, which
+    would otherwise walk the board once each.
+
+    Args:
+        player: The player whose board to resolve.
+
+    Returns:
+        Tuple of (passive ability result, monsters counting towards the
+        board limit).
+    """
     result = PassiveAbilityResult()
     econome_count = 0
+    # Ids of cards that may count as monsters; demons never do
+    monster_ids: list[str] = []
 
     for card in player.board:
+        if card.card_type != CardType.DEMON:
+            monster_ids.append(card.id)
+
         passive = card.class_abilities.passive
 
         if not passive:
@@ -1138,17 +1395,14 @@ def resolve_passive_abilities(player: PlayerState) -> PassiveAbilityResult:
         if not passive:
             continue
 
-        passive_lower = passive.lower()
+        passive_lower = _normalize_text(passive)
 
         # S-Team: doesn't count as monster
         if "ne compte pas comme un monstre" in passive_lower:
             result.cards_excluded_from_count.append(card.id)
 
         # Econome: extra PO generation
-        if (
-            "économes apportent" in passive_lower
-            or "economes apportent" in passive_lower
-        ):
+        if "economes apportent" in passive_lower:
             econome_count += 1
 
     # Econome passive: each Econome adds 1 extra PO
@@ -1157,7 +1411,51 @@ def resolve_passive_abilities(player: PlayerState) -> PassiveAbilityResult:
     if econome_count > 0:
         result.extra_po = econome_count
 
-    return result
+    # S-Team cards don't count (excluded by id, so every copy is skipped)
+    monster_count = len(monster_ids)
+    if result.cards_excluded_from_count:
+        excluded_ids = set(result.cards_excluded_from_count)
+        monster_count -= sum(map(excluded_ids.__contains__, monster_ids))
+
+    return result, monster_count
+
+
+def _active_class_tiers(
+    player: PlayerState, card_class: CardClass, count: int
+) -> Iterator[ScalingAbility]:
+    """Yield the active scaling tier of each card of a class, in board order.
+
+    Cards without class scaling or without a tier met by count are skipped.
+    Class abilities are normally shared by the whole class, so the first card
+    of the class from the board counts usually answers; the rest of the board
+    is only walked when it does not, or when the caller asks for more.
+
+    Args:
+        player: The player whose board to read.
+        card_class: The class whose cards to read (demons are never read).
+        count: Number of non-demon cards of the class on the board.
+
+    Yields:
+        The active ScalingAbility of each matching card.
+    """
+    first = _board_counts(player)[2][card_class]
+    scaling = first.class_abilities.scaling
+    if scaling:
+        active = get_active_scaling_ability(scaling, count)
+        if active is not None:
+            yield active
+
+    for card in player.board:
+        if card is first or card.card_class != card_class:
+            continue
+        if card.card_type == CardType.DEMON:
+            continue
+        scaling = card.class_abilities.scaling
+        if not scaling:
+            continue
+        active = get_active_scaling_ability(scaling, count)
+        if active is not None:
+            yield active
 
 
 def resolve_forgeron_abilities(player: PlayerState) -> int:
@@ -1174,33 +1472,14 @@ def resolve_forgeron_abilities(player: PlayerState) -> int:
     Returns:
         Number of weapons to draw.
     """
-    forgeron_count = sum(
-        1
-        for card in player.board
-        if card.card_class == CardClass.FORGERON and card.card_type != CardType.DEMON
-    )
+    forgeron_count = _board_counts(player)[0][CardClass.FORGERON]
 
     if forgeron_count == 0:
         return 0
 
-    # Find a Forgeron card to get its scaling abilities
-    for card in player.board:
-        if card.card_class != CardClass.FORGERON:
-            continue
-        if card.card_type == CardType.DEMON:
-            continue
-
-        scaling = card.class_abilities.scaling
-        if not scaling:
-            continue
-
-        # Get the active scaling ability
-        active = get_active_scaling_ability(scaling, forgeron_count)
-        if not active:
-            continue
-
+    for active in _active_class_tiers(player, CardClass.FORGERON, forgeron_count):
         # Parse the number of weapons to draw
-        effect_lower = active.effect.lower()
+        effect_lower = _normalize_text(active.effect)
         if "piocher une arme" in effect_lower:
             return 1
         elif "2 armes" in effect_lower:
@@ -1211,6 +1490,32 @@ def resolve_forgeron_abilities(player: PlayerState) -> int:
     return 0
 
 
+@cache
+def _invocateur_summoned_demon(effect_text: str) -> str | None:
+    """Get the demon summoned by an Invocateur scaling effect.
+
+    Checked from the highest tier down, so cumulative effect texts summon
+    only their strongest demon. Depends only on the effect text, so the
+    patterns run once per distinct effect.
+
+    Args:
+        effect_text: The Invocateur scaling effect description.
+
+    Returns:
+        The name of the demon to summon, or None if the effect summons none.
+    """
+    effect = _normalize_text(effect_text)
+    if _SUMMON_DEMON_MAJEUR_PATTERN.search(effect):
+        return "Demon Majeur"
+    if _SUMMON_SUCCUBE_PATTERN.search(effect):
+        return "Succube"
+    if _SUMMON_DEMON_MINEUR_PATTERN.search(effect):
+        return "Demon mineur"
+    if _SUMMON_DIABLOTIN_PATTERN.search(effect):
+        return "Diablotin"
+    return None
+
+
 def resolve_invocateur_abilities(player: PlayerState) -> InvocateurAbilityResult:
     """Resolve Invocateur demon summoning ability.
 
@@ -1228,58 +1533,41 @@ def resolve_invocateur_abilities(player: PlayerState) -> InvocateurAbilityResult
     """
     result = InvocateurAbilityResult()
 
-    invocateur_count = sum(
-        1
-        for card in player.board
-        if card.card_class == CardClass.INVOCATEUR and card.card_type != CardType.DEMON
-    )
+    invocateur_count = _board_counts(player)[0][CardClass.INVOCATEUR]
 
     if invocateur_count == 0:
         return result
 
-    # Find an Invocateur card to get its scaling abilities
-    for card in player.board:
-        if card.card_class != CardClass.INVOCATEUR:
-            continue
-        if card.card_type == CardType.DEMON:
-            continue
+    # Get the active scaling ability based on Invocateur count; only one
+    # Invocateur's abilities are processed
+    active = next(
+        _active_class_tiers(player, CardClass.INVOCATEUR, invocateur_count), None
+    )
+    if active is None:
+        return result
 
-        scaling = card.class_abilities.scaling
-        if not scaling:
-            continue
+    # Determine which demon to summon (cumulative - summon highest tier)
+    demon_name = _invocateur_summoned_demon(active.effect)
+    if demon_name is not None:
+        result.demons_to_summon.append(demon_name)
+        result.effects.append(
+            f"Invocateur threshold {active.threshold}: Summon {demon_name}"
+        )
 
-        # Get the active scaling ability based on Invocateur count
-        active = get_active_scaling_ability(scaling, invocateur_count)
-        if not active:
-            continue
+    return result
 
-        effect = active.effect
 
-        # Determine which demon to summon (cumulative - summon highest tier)
-        if _SUMMON_DEMON_MAJEUR_PATTERN.search(effect):
-            result.demons_to_summon.append("Demon Majeur")
-            result.effects.append(
-                f"Invocateur threshold {active.threshold}: Summon Demon Majeur"
-            )
-        elif _SUMMON_SUCCUBE_PATTERN.search(effect):
-            result.demons_to_summon.append("Succube")
-            result.effects.append(
-                f"Invocateur threshold {active.threshold}: Summon Succube"
-            )
-        elif _SUMMON_DEMON_MINEUR_PATTERN.search(effect):
-            result.demons_to_summon.append("Demon mineur")
-            result.effects.append(
-                f"Invocateur threshold {active.threshold}: Summon Demon mineur"
-            )
-        elif _SUMMON_DIABLOTIN_PATTERN.search(effect):
-            result.demons_to_summon.append("Diablotin")
-            result.effects.append(
-                f"Invocateur threshold {active.threshold}: Summon Diablotin"
-            )
+@cache
+def _draws_cost5_card(effect_text: str) -> bool:
+    """Check whether a Monture scaling effect draws a cost-5 card.
 
-        break  # Only process one Invocateur's abilities
+    Args:
+        effect_text: The Monture scaling effect description.
 
-    return result
+    Returns:
+        True if the effect draws a cost-5 card.
+    """
+    return _DRAW_COST_5_PATTERN.search(_normalize_text(effect_text)) is not None
 
 
 def resolve_monture_abilities(player: PlayerState) -> MontureAbilityResult:
@@ -1296,41 +1584,23 @@ def resolve_monture_abilities(player: PlayerState) -> MontureAbilityResult:
     """
     result = MontureAbilityResult()
 
-    monture_count = sum(
-        1
-        for card in player.board
-        if card.card_class == CardClass.MONTURE and card.card_type != CardType.DEMON
-    )
+    monture_count = _board_counts(player)[0][CardClass.MONTURE]
 
     if monture_count == 0:
         return result
 
-    # Find a Monture card to get its scaling abilities
-    for card in player.board:
-        if card.card_class != CardClass.MONTURE:
-            continue
-        if card.card_type == CardType.DEMON:
-            continue
-
-        scaling = card.class_abilities.scaling
-        if not scaling:
-            continue
-
-        # Get the active scaling ability based on Monture count
-        active = get_active_scaling_ability(scaling, monture_count)
-        if not active:
-            continue
-
-        effect = active.effect
-
-        # Check for cost-5 card draw
-        if _DRAW_COST_5_PATTERN.search(effect):
-            result.cards_to_draw = 1
-            result.effects.append(
-                f"Monture threshold {active.threshold}: Draw 1 cost-5 card"
-            )
+    # Get the active scaling ability based on Monture count; only one
+    # Monture's abilities are processed
+    active = next(_active_class_tiers(player, CardClass.MONTURE, monture_count), None)
+    if active is None:
+        return result
 
-        break  # Only process one Monture's abilities
+    # Check for cost-5 card draw
+    if _draws_cost5_card(active.effect):
+        result.cards_to_draw = 1
+        result.effects.append(
+            f"Monture threshold {active.threshold}: Draw 1 cost-5 card"
+        )
 
     return result
 
@@ -1347,21 +1617,10 @@ def count_board_monsters(player: PlayerState) -> int:
     Returns:
         Number of monsters counting towards board limit.
     """
-    passives = resolve_passive_abilities(player)
-    excluded_ids = set(passives.cards_excluded_from_count)
-
-    count = 0
-    for card in player.board:
-        if card.card_type == CardType.DEMON:
-            continue  # Demons don't count towards board limit
-        if card.id in excluded_ids:
-            continue  # S-Team cards don't count
-        count += 1
-
-    return count
+    return _resolve_passives_and_count(player)[1]
 
 
-@dataclass
+@dataclass(slots=True)
 class LapinBoardLimitResult:
     """Result of calculating Lapin board limit.
 
@@ -1407,7 +1666,7 @@ def calculate_lapin_board_limit(
     result = LapinBoardLimitResult(base_limit=base_limit)
 
     # Count Lapin cards on board for family threshold
-    lapin_count = sum(1 for card in player.board if card.family == Family.LAPIN)
+    lapin_count = _board_counts(player)[1][Family.LAPIN]
 
     # Calculate family threshold bonus
     # These are cumulative: at 5 Lapins, you get both +1 (from 3) and +2 (from 5) = +3
@@ -1429,7 +1688,7 @@ def calculate_lapin_board_limit(
         if not card.bonus_text:
             continue
 
-        match = _LAPIN_BOARD_EXPANSION_PATTERN.search(card.bonus_text)
+        match = _LAPIN_BOARD_EXPANSION_PATTERN.search(_normalize_text(card.bonus_text))
         if match:
             bonus = int(match.group(1))
             result.lapincruste_bonus += bonus
@@ -1456,7 +1715,7 @@ def can_play_lapin_card(
     limit_result = calculate_lapin_board_limit(player, base_limit)
 
     # Count current Lapin cards on board
-    lapin_count = sum(1 for card in player.board if card.family == Family.LAPIN)
+    lapin_count = _board_counts(player)[1][Family.LAPIN]
 
     return lapin_count < limit_result.total_limit
 
@@ -1488,7 +1747,7 @@ def resolve_bonus_text_effects(
         player: The player whose bonus_text to resolve.
         opponent: Optional opponent for opponent-dependent effects.
         game_state: Optional game state for deck-dependent effects (deck reveal).
-            If None, deck reveal effects use a fallback approximation (avg_atk=3).
+            If None, deck reveal effects use a fallback average ATK.
         strict: If True, raise UnmatchedBonusTextError for unrecognized patterns.
             Default is False (silent ignore for backwards compatibility).
 
@@ -1500,90 +1759,56 @@ def resolve_bonus_text_effects(
             any known pattern.
     """
     result = BonusTextResult()
-    class_counts = count_cards_by_class(player)
-    family_counts = count_cards_by_family(player)
-
-    # Map for French names to Family/Class
-    family_map = {
-        "cyborg": Family.CYBORG,
-        "cyborgs": Family.CYBORG,
-        "nature": Family.NATURE,
-        "atlantide": Family.ATLANTIDE,
-        "ninja": Family.NINJA,
-        "ninjas": Family.NINJA,
-        "neige": Family.NEIGE,
-        "lapin": Family.LAPIN,
-        "lapins": Family.LAPIN,
-        "raton": Family.RATON,
-        "ratons": Family.RATON,
-        "raccoon": Family.RATON,
-        "hall": Family.HALL_OF_WIN,
-    }
-
-    class_map_lower = {
-        "combattants": CardClass.COMBATTANT,
-        "combattant": CardClass.COMBATTANT,
-        "défenseurs": CardClass.DEFENSEUR,
-        "defenseurs": CardClass.DEFENSEUR,
-        "défenseur": CardClass.DEFENSEUR,
-        "defenseur": CardClass.DEFENSEUR,
-        "mages": CardClass.MAGE,
-        "mage": CardClass.MAGE,
-        "archers": CardClass.ARCHER,
-        "archer": CardClass.ARCHER,
-        "dragons": CardClass.DRAGON,
-        "dragon": CardClass.DRAGON,
-        "s-team": CardClass.S_TEAM,
-        "econome": CardClass.ECONOME,
-        "économes": CardClass.ECONOME,
-        "economes": CardClass.ECONOME,
-    }
-
-    # Helper: check if a specific card is on any board
-    def card_on_any_board(card_name: str) -> bool:
-        """Check if a card with the given name is on any player's board."""
-        name_lower = card_name.lower()
-        # Check player's board
-        for c in player.board:
-            if name_lower in c.name.lower():
-                return True
-        # Check opponent's board if available
-        if opponent:
-            for c in opponent.board:
-                if name_lower in c.name.lower():
-                    return True
-        return False
+    class_counts, family_counts, _ = _board_counts(player)
+
+    # Card names on each board, normalised and joined once per call so name
+    # checks are a single substring search. Names never contain newlines, so
+    # a match cannot straddle two names.
+    player_names = "\n".join([_normalize_text(c.name) for c in player.board])
+    opponent_names = (
+        "\n".join([_normalize_text(c.name) for c in opponent.board]) if opponent else ""
+    )
 
     # Helper: check if a specific card is on player's board
     def card_on_player_board(card_name: str) -> bool:
         """Check if a card with the given name is on player's board."""
-        name_lower = card_name.lower()
-        for c in player.board:
-            if name_lower in c.name.lower():
-                return True
-        return False
+        return _normalize_text(card_name) in player_names
+
+    # Named cards that card-specific bonuses depend on, checked once per call
+    # rather than once per card carrying such a bonus.
+    joe_on_board = "joe" in player_names or "joe" in opponent_names
+    reine_on_board = "reine" in player_names or "reine" in opponent_names
+    # Card is actually named "Ratons Mignons" (plural)
+    raton_mignon_on_board = "ratons mignons" in player_names
+    maitre_rat_on_board = "maitre rat" in player_names
+    # Diplo partners present on the board, built on first use (Diplo cards only)
+    diplo_on_board: set[str] | None = None
+    # Demons with bonus_text seen on the way, for their own pass below
+    demons: list[tuple[Card, str]] = []
 
     for card in player.board:
-        if card.card_type == CardType.DEMON:
-            continue  # Demons can't benefit from most bonuses
-
         bonus = card.bonus_text
         if not bonus:
             continue
 
-        bonus_lower = bonus.lower()
+        if card.card_type == CardType.DEMON:
+            demons.append((card, bonus))
+            continue  # Demons can't benefit from most bonuses
+
+        bonus_lower = _normalize_text(bonus)
+        matches = _match_bonus_text(bonus_lower)
 
         # Strict mode validation: check if this bonus_text matches any known pattern
-        if strict and not _bonus_text_matches_any_pattern(bonus):
+        if strict and not any(matches):
             raise UnmatchedBonusTextError(card.name, bonus)
 
         # === NEGATIVE ATK MODIFIERS ===
-        neg_match = _NEGATIVE_ATK_FOR_CLASS_PATTERN.search(bonus)
+        neg_match = matches.negative_atk_for_class
         if neg_match:
             penalty = int(neg_match.group(1))
-            target_name = neg_match.group(2).lower()
-            if target_name in class_map_lower:
-                target_class = class_map_lower[target_name]
+            target_name = neg_match.group(2)
+            if target_name in _BONUS_TARGET_CLASSES:
+                target_class = _BONUS_TARGET_CLASSES[target_name]
                 matching = class_counts.get(target_class, 0)
                 if matching > 0:
                     result.attack_penalty += penalty * matching
@@ -1592,33 +1817,33 @@ def resolve_bonus_text_effects(
                     )
 
         # === ON-ATTACKED DAMAGE ===
-        on_attacked_match = _ON_ATTACKED_DAMAGE_PATTERN.search(bonus)
+        on_attacked_match = matches.on_attacked_damage
         if on_attacked_match:
             damage = int(on_attacked_match.group(1))
             result.on_attacked_damage += damage
             result.effects.append(f"{card.name}: {bonus}")
 
         # === PER-TURN IMBLOCABLE ===
-        per_turn_imb_match = _PER_TURN_IMBLOCABLE_PATTERN.search(bonus)
+        per_turn_imb_match = matches.per_turn_imblocable
         if per_turn_imb_match:
             imb_damage = int(per_turn_imb_match.group(1))
             result.per_turn_imblocable += imb_damage
             result.effects.append(f"{card.name}: {bonus}")
 
         # === FLAT IMBLOCABLE DAMAGE ===
-        flat_imb_match = _FLAT_IMBLOCABLE_PATTERN.search(bonus)
+        flat_imb_match = matches.flat_imblocable
         if flat_imb_match:
             imb_damage = int(flat_imb_match.group(1))
             result.flat_imblocable_damage += imb_damage
             result.effects.append(f"{card.name}: {imb_damage} imblocable")
 
         # === LIFELINK ===
-        if _LIFELINK_PATTERN.search(bonus):
+        if matches.lifelink:
             result.lifelink = True
             result.effects.append(f"{card.name}: lifelink")
 
         # === SPELL DAMAGE BLOCKING ===
-        spell_block_match = _SPELL_DAMAGE_BLOCK_PATTERN.search(bonus)
+        spell_block_match = matches.spell_damage_block
         if spell_block_match:
             block_amount = int(spell_block_match.group(1))
             result.spell_damage_block += block_amount
@@ -1626,25 +1851,25 @@ def resolve_bonus_text_effects(
 
         # === PO GENERATION ===
         # "+X PO / tour si [family] Y" - Per-turn PO if threshold met
-        po_turn_match = _PO_PER_TURN_IF_PATTERN.search(bonus)
+        po_turn_match = matches.po_per_turn_if
         if po_turn_match:
             po_bonus = int(po_turn_match.group(1))
-            target_name = po_turn_match.group(2).lower()
+            target_name = po_turn_match.group(2)
             threshold = int(po_turn_match.group(3))
             # Check family or class threshold
-            if target_name in family_map:
-                target_family = family_map[target_name]
+            if target_name in _BONUS_TARGET_FAMILIES:
+                target_family = _BONUS_TARGET_FAMILIES[target_name]
                 if family_counts.get(target_family, 0) >= threshold:
                     result.per_turn_po += po_bonus
                     result.effects.append(f"{card.name}: {bonus}")
-            elif target_name in class_map_lower:
-                target_class = class_map_lower[target_name]
+            elif target_name in _BONUS_TARGET_CLASSES:
+                target_class = _BONUS_TARGET_CLASSES[target_name]
                 if class_counts.get(target_class, 0) >= threshold:
                     result.per_turn_po += po_bonus
                     result.effects.append(f"{card.name}: {bonus}")
 
         # "+X PO par tranche de Y ratons"
-        po_ratons_match = _PO_PER_RATONS_PATTERN.search(bonus)
+        po_ratons_match = matches.po_per_ratons
         if po_ratons_match:
             po_per = int(po_ratons_match.group(1))
             per_count = int(po_ratons_match.group(2))
@@ -1655,7 +1880,7 @@ def resolve_bonus_text_effects(
                 result.effects.append(f"{card.name}: {bonus} ({tranches} tranches)")
 
         # === RACCOON FAMILY BONUS ===
-        raccoon_match = _RACCOON_FAMILY_BONUS_PATTERN.search(bonus)
+        raccoon_match = matches.raccoon_family_bonus
         if raccoon_match:
             atk_bonus = int(raccoon_match.group(1))
             raton_count = family_counts.get(Family.RATON, 0)
@@ -1664,7 +1889,7 @@ def resolve_bonus_text_effects(
                 result.effects.append(f"{card.name}: {bonus} ({raton_count} ratons)")
 
         # === SOLO NINJA BONUS ===
-        solo_ninja_match = _SOLO_NINJA_PATTERN.search(bonus)
+        solo_ninja_match = matches.solo_ninja
         if solo_ninja_match:
             atk_bonus = int(solo_ninja_match.group(1))
             ninja_count = family_counts.get(Family.NINJA, 0)
@@ -1674,52 +1899,47 @@ def resolve_bonus_text_effects(
 
         # === CARD-SPECIFIC BONUSES ===
         # "+X dgts si Joe est sur plateau"
-        joe_match = _BONUS_IF_JOE_PATTERN.search(bonus)
+        joe_match = matches.bonus_if_joe
         if joe_match:
             atk_bonus = int(joe_match.group(1))
-            if card_on_any_board("joe"):
+            if joe_on_board:
                 result.attack_bonus += atk_bonus
                 result.effects.append(f"{card.name}: {bonus}")
 
         # "+X ATQ si la Reine est en jeu"
-        reine_match = _BONUS_IF_REINE_PATTERN.search(bonus)
+        reine_match = matches.bonus_if_reine
         if reine_match:
             atk_bonus = int(reine_match.group(1))
-            if card_on_any_board("reine"):
+            if reine_on_board:
                 result.attack_bonus += atk_bonus
                 result.effects.append(f"{card.name}: {bonus}")
 
         # "Gagne +X ATQ si Raton Mignon"
-        raton_mignon_match = _BONUS_IF_RATON_MIGNON_PATTERN.search(bonus)
+        raton_mignon_match = matches.bonus_if_raton_mignon
         if raton_mignon_match:
             atk_bonus = int(raton_mignon_match.group(1))
-            # Card is actually named "Ratons Mignons" (plural)
-            if card_on_player_board("ratons mignons"):
+            if raton_mignon_on_board:
                 result.attack_bonus += atk_bonus
                 result.effects.append(f"{card.name}: {bonus}")
 
         # "+X ATQ/+Y PV si maître rat"
-        maitre_rat_match = _BONUS_IF_MAITRE_RAT_PATTERN.search(bonus)
+        maitre_rat_match = matches.bonus_if_maitre_rat
         if maitre_rat_match:
             atk_bonus = int(maitre_rat_match.group(1))
-            if card_on_player_board("maître rat") or card_on_player_board("maitre rat"):
+            if maitre_rat_on_board:
                 result.attack_bonus += atk_bonus
                 result.effects.append(f"{card.name}: {bonus}")
                 # Also check for PV bonus
-                pv_match = _PV_IF_MAITRE_RAT_PATTERN.search(bonus)
+                pv_match = matches.pv_if_maitre_rat
                 if pv_match:
                     pv_bonus = int(pv_match.group(1))
                     result.health_bonus += pv_bonus
 
         # "Gagne +X ATQ par économes sur le plateau ennemi"
-        econome_enemy_match = _ATK_PER_ENEMY_ECONOME_PATTERN.search(bonus)
+        econome_enemy_match = matches.atk_per_enemy_econome
         if econome_enemy_match and opponent:
             atk_per = int(econome_enemy_match.group(1))
-            enemy_economes = sum(
-                1
-                for c in opponent.board
-                if c.card_class == CardClass.ECONOME and c.card_type != CardType.DEMON
-            )
+            enemy_economes = _board_counts(opponent)[0][CardClass.ECONOME]
             if enemy_economes > 0:
                 result.attack_bonus += atk_per * enemy_economes
                 result.effects.append(
@@ -1728,15 +1948,15 @@ def resolve_bonus_text_effects(
 
         # === EXISTING PATTERNS ===
         # Pattern: "+X ATQ si bonus [Class] Y" (threshold-based)
-        threshold_match = _BONUS_IF_THRESHOLD_PATTERN.search(bonus)
+        threshold_match = matches.bonus_if_threshold
         if threshold_match:
             atk_bonus = int(threshold_match.group(1))
-            target_name = threshold_match.group(2).lower()
+            target_name = threshold_match.group(2)
             threshold = int(threshold_match.group(3))
 
             # Check if the threshold is met
-            target_class = class_map_lower.get(target_name)
-            target_family = family_map.get(target_name)
+            target_class = _BONUS_TARGET_CLASSES.get(target_name)
+            target_family = _BONUS_TARGET_FAMILIES.get(target_name)
             if target_class and class_counts.get(target_class, 0) >= threshold:
                 result.attack_bonus += atk_bonus
                 result.effects.append(f"{card.name}: {bonus}")
@@ -1746,30 +1966,27 @@ def resolve_bonus_text_effects(
             continue  # Don't double-process with for_match
 
         # Pattern: "+X ATQ pour les [target]" or "+X ATQ aux [target]"
-        for_match = _BONUS_FOR_FAMILY_PATTERN.search(bonus)
+        for_match = matches.bonus_for_family
         if for_match:
             atk_bonus = int(for_match.group(1))
-            target_name = for_match.group(2).lower()
+            target_name = for_match.group(2)
 
             # Skip if already handled by more specific patterns
             if "raccoon" in bonus_lower and "familly" in bonus_lower:
                 continue  # Handled by raccoon pattern
 
             # Check if it's a family
-            if target_name in family_map:
-                target_family = family_map[target_name]
-                # Count cards of that family
-                matching = sum(
-                    1
-                    for c in player.board
-                    if c.family == target_family and c.card_type != CardType.DEMON
-                )
+            if target_name in _BONUS_TARGET_FAMILIES:
+                target_family = _BONUS_TARGET_FAMILIES[target_name]
+                # Count cards of that family (never the Démon family, so the
+                # board count needs no demon filtering)
+                matching = family_counts[target_family]
                 if matching > 0:
                     result.attack_bonus += atk_bonus * matching
                     result.effects.append(f"{card.name}: {bonus} ({matching} cards)")
             # Check if it's a class
-            elif target_name in class_map_lower:
-                target_class = class_map_lower[target_name]
+            elif target_name in _BONUS_TARGET_CLASSES:
+                target_class = _BONUS_TARGET_CLASSES[target_name]
                 matching = class_counts.get(target_class, 0)
                 if matching > 0:
                     result.attack_bonus += atk_bonus * matching
@@ -1778,20 +1995,20 @@ def resolve_bonus_text_effects(
         # === LAPIN-SPECIFIC PATTERNS ===
 
         # "+X PV /tour si [family] Y" - PV healing per turn if threshold met
-        pv_turn_match = _PV_PER_TURN_IF_PATTERN.search(bonus)
+        pv_turn_match = matches.pv_per_turn_if
         if pv_turn_match:
             pv_bonus = int(pv_turn_match.group(1))
-            target_name = pv_turn_match.group(2).lower()
+            target_name = pv_turn_match.group(2)
             threshold = int(pv_turn_match.group(3))
             # Check family threshold
-            if target_name in family_map:
-                target_family = family_map[target_name]
+            if target_name in _BONUS_TARGET_FAMILIES:
+                target_family = _BONUS_TARGET_FAMILIES[target_name]
                 if family_counts.get(target_family, 0) >= threshold:
                     result.per_turn_pv_heal += pv_bonus
                     result.effects.append(f"{card.name}: {bonus}")
 
         # "+X PO si Lapin Y / +Z PO si Lapin W" - Multi-threshold PO
-        multi_po_match = _MULTI_PO_IF_PATTERN.search(bonus)
+        multi_po_match = matches.multi_po_if
         if multi_po_match:
             po1 = int(multi_po_match.group(1))
             threshold1 = int(multi_po_match.group(2))
@@ -1807,22 +2024,22 @@ def resolve_bonus_text_effects(
                 result.effects.append(f"{card.name}: +{po1} PO (Lapin {threshold1})")
 
         # "-X ATQ si [CardName]" - Card-conditional ATK penalty
-        atk_penalty_match = _ATK_PENALTY_IF_CARD_PATTERN.search(bonus)
+        atk_penalty_match = matches.atk_penalty_if_card
         if atk_penalty_match:
             penalty = int(atk_penalty_match.group(1))
-            card_name = atk_penalty_match.group(2).strip().lower()
+            card_name = atk_penalty_match.group(2).strip()
             # Check if the specified card is on player's board
             if card_on_player_board(card_name):
                 result.attack_penalty += penalty
                 result.effects.append(f"{card.name}: -{penalty} ATQ ({card_name})")
 
         # "Les [family] ont minimum X ATQ" - Minimum ATK floor
-        min_atk_match = _MIN_ATK_FLOOR_PATTERN.search(bonus)
+        min_atk_match = matches.min_atk_floor
         if min_atk_match:
-            target_name = min_atk_match.group(1).lower()
+            target_name = min_atk_match.group(1)
             min_atk = int(min_atk_match.group(2))
-            if target_name in family_map:
-                target_family = family_map[target_name]
+            if target_name in _BONUS_TARGET_FAMILIES:
+                target_family = _BONUS_TARGET_FAMILIES[target_name]
                 # Store the floor - it will be applied during damage calculation
                 if min_atk > result.min_atk_floor:
                     result.min_atk_floor = min_atk
@@ -1830,7 +2047,7 @@ def resolve_bonus_text_effects(
                     result.effects.append(f"{card.name}: {bonus}")
 
         # "retourner une carte de la pile, gagne son ATQ" - Deck reveal ATK
-        deck_reveal_match = _DECK_REVEAL_ATK_PATTERN.search(bonus)
+        deck_reveal_match = matches.deck_reveal_atk
         if deck_reveal_match:
             # This effect reveals a card from deck and adds its ATK
             if game_state is not None:
@@ -1849,16 +2066,15 @@ def resolve_bonus_text_effects(
                     result.effects.append(f"{card.name}: {bonus} (deck empty)")
             else:
                 # Fallback approximation when game_state not provided
-                avg_atk = 3  # Average card ATK as approximation
-                result.deck_reveal_atk += avg_atk
-                result.effects.append(f"{card.name}: {bonus} (~{avg_atk} ATK)")
+                result.deck_reveal_atk += _DECK_REVEAL_FALLBACK_ATK
+                result.effects.append(
+                    f"{card.name}: {bonus} (~{_DECK_REVEAL_FALLBACK_ATK} ATK)"
+                )
 
         # === DECK REVEAL WITH MULTIPLIER (Yetiir) ===
-        deck_mult_match = _DECK_REVEAL_MULT_PATTERN.search(bonus)
+        deck_mult_match = matches.deck_reveal_mult
         if deck_mult_match:
-            multiplier = 1
-            if deck_mult_match.group(1):
-                multiplier = int(deck_mult_match.group(1))
+            multiplier = int(deck_mult_match.group(1) or 1)
 
             if game_state is not None:
                 # Use actual deck reveal
@@ -1879,82 +2095,76 @@ def resolve_bonus_text_effects(
                     result.effects.append(f"{card.name}: {bonus} (deck empty)")
             else:
                 # Fallback approximation
-                avg_atk = 3
-                result.deck_reveal_atk += avg_atk
+                result.deck_reveal_atk += _DECK_REVEAL_FALLBACK_ATK
                 result.deck_reveal_multiplier = max(
                     result.deck_reveal_multiplier, multiplier
                 )
                 result.effects.append(
-                    f"{card.name}: {bonus} (~{avg_atk * multiplier} ATK)"
+                    f"{card.name}: {bonus} "
+                    f"(~{_DECK_REVEAL_FALLBACK_ATK * multiplier} ATK)"
                 )
 
         # === DIPLO SYNERGY ===
-        diplo_combined = _DIPLO_COMBINED_PATTERN.search(bonus)
+        diplo_combined = matches.diplo_combined
         if diplo_combined:
             atk_bonus_val = int(diplo_combined.group(1))
-            atk_diplo = diplo_combined.group(2).lower()
+            atk_diplo = diplo_combined.group(2)
             pv_bonus_val = int(diplo_combined.group(3))
-            pv_diplo = diplo_combined.group(4).lower()
+            pv_diplo = diplo_combined.group(4)
 
             # Check if we have the required Diplo cards
-            diplo_cards_on_board = [
-                c.card_class.value.lower()
-                for c in player.board
-                if c.card_class == CardClass.DIPLO
-            ]
-            # Also check card names for Diplo-Terre, Diplo-Air, Diplo-Mer
-            for c in player.board:
-                name_lower = c.name.lower()
-                if "diplo-terre" in name_lower or "diplo terre" in name_lower:
-                    diplo_cards_on_board.append("terre")
-                if "diplo-air" in name_lower or "diplo air" in name_lower:
-                    diplo_cards_on_board.append("air")
-                if "diplo-mer" in name_lower or "diplo mer" in name_lower:
-                    diplo_cards_on_board.append("mer")
-
-            if atk_diplo in diplo_cards_on_board:
+            if diplo_on_board is None:
+                diplo_on_board = set()
+                if class_counts[CardClass.DIPLO]:
+                    diplo_on_board.add("diplo")
+                # Also check card names for Diplo-Terre, Diplo-Air, Diplo-Mer
+                for partner, *names in _DIPLO_PARTNER_NAMES:
+                    if any(name in player_names for name in names):
+                        diplo_on_board.add(partner)
+
+            if atk_diplo in diplo_on_board:
                 result.diplo_atk_bonus += atk_bonus_val
                 result.effects.append(
                     f"{card.name}: +{atk_bonus_val} ATQ (Diplo {atk_diplo})"
                 )
-            if pv_diplo in diplo_cards_on_board:
+            if pv_diplo in diplo_on_board:
                 result.diplo_pv_bonus += pv_bonus_val
                 result.effects.append(
                     f"{card.name}: +{pv_bonus_val} PV (Diplo {pv_diplo})"
                 )
 
         # === SPELL DAMAGE ===
-        spell_damage_match = _SPELL_DAMAGE_PATTERN.search(bonus)
+        spell_damage_match = matches.spell_damage
         if spell_damage_match:
             damage = int(spell_damage_match.group(1))
             result.spell_damage += damage
             result.effects.append(f"{card.name}: sort {damage} dgt")
 
-        spell_bonus_match = _SPELL_DAMAGE_BONUS_PATTERN.search(bonus)
+        spell_bonus_match = matches.spell_damage_bonus
         if spell_bonus_match:
             bonus_val = int(spell_bonus_match.group(1))
             result.spell_damage_bonus += bonus_val
             result.effects.append(f"{card.name}: +{bonus_val} dgt sorts")
 
-        magie_carottes_match = _MAGIE_CAROTTES_PATTERN.search(bonus)
+        magie_carottes_match = matches.magie_carottes
         if magie_carottes_match:
             damage = int(magie_carottes_match.group(1))
             result.spell_damage += damage
             result.effects.append(f"{card.name}: Magie carottes {damage} dgt")
 
         # === DEFENSE MULTIPLIER ===
-        if _DOUBLE_PV_DEFENSE_PATTERN.search(bonus):
+        if matches.double_pv_defense:
             result.defense_multiplier = max(result.defense_multiplier, 2)
             result.effects.append(f"{card.name}: Double PV défense")
 
         # === ATK/PV TRADEOFF FOR CLASS ===
-        tradeoff_match = _ATK_PV_TRADEOFF_CLASS_PATTERN.search(bonus)
+        tradeoff_match = matches.atk_pv_tradeoff_class
         if tradeoff_match:
             atk_val = int(tradeoff_match.group(1))
             pv_val = int(tradeoff_match.group(2))
-            target_class_name = tradeoff_match.group(3).lower()
-            if target_class_name in class_map_lower:
-                target_class = class_map_lower[target_class_name]
+            target_class_name = tradeoff_match.group(3)
+            if target_class_name in _BONUS_TARGET_CLASSES:
+                target_class = _BONUS_TARGET_CLASSES[target_class_name]
                 matching = class_counts.get(target_class, 0)
                 if matching > 0:
                     result.attack_bonus += atk_val * matching
@@ -1965,13 +2175,13 @@ def resolve_bonus_text_effects(
                     )
 
         # === DEMON BONUSES ===
-        demon_imb_match = _DEMON_IMBLOCABLE_BONUS_PATTERN.search(bonus)
+        demon_imb_match = matches.demon_imblocable_bonus
         if demon_imb_match:
             imb_bonus = int(demon_imb_match.group(1))
             result.demon_imblocable_bonus += imb_bonus
             result.effects.append(f"{card.name}: +{imb_bonus} imb démon")
 
-        demon_atk_pv_match = _DEMON_ATK_PV_PATTERN.search(bonus)
+        demon_atk_pv_match = matches.demon_atk_pv
         if demon_atk_pv_match:
             atk_val = int(demon_atk_pv_match.group(1))
             pv_val = int(demon_atk_pv_match.group(2))
@@ -1979,12 +2189,12 @@ def resolve_bonus_text_effects(
             result.demon_pv_penalty += pv_val
             result.effects.append(f"{card.name}: +{atk_val}/-{pv_val} démon")
 
-        if _DEMONS_GAIN_BONUSES_PATTERN.search(bonus):
+        if matches.demons_gain_bonuses:
             result.demons_gain_all_bonuses = True
             result.effects.append(f"{card.name}: Démons gagnent tous bonus")
 
         # === WEAPON/EQUIPMENT ===
-        weapon_ninja_match = _WEAPON_ATK_IF_NINJA_PATTERN.search(bonus)
+        weapon_ninja_match = matches.weapon_atk_if_ninja
         if weapon_ninja_match:
             # OQ008: Only apply bonus if ninja was selected during draft
             if player.ninja_selected:
@@ -1992,7 +2202,7 @@ def resolve_bonus_text_effects(
                 result.weapon_atk_bonus += atk_val
                 result.effects.append(f"{card.name}: +{atk_val} ATQ armes (ninja)")
 
-        weapon_raton_match = _WEAPON_ATK_PER_RATON_PATTERN.search(bonus)
+        weapon_raton_match = matches.weapon_atk_per_raton
         if weapon_raton_match:
             atk_per = int(weapon_raton_match.group(1))
             raton_count = family_counts.get(Family.RATON, 0)
@@ -2004,20 +2214,20 @@ def resolve_bonus_text_effects(
                 )
 
         # === KDO (GIFT) BONUSES ===
-        kdo_pv_match = _KDO_PV_BONUS_PATTERN.search(bonus)
+        kdo_pv_match = matches.kdo_pv_bonus
         if kdo_pv_match:
             pv_per = int(kdo_pv_match.group(1))
             result.kdo_pv_bonus = max(result.kdo_pv_bonus, pv_per)
             result.effects.append(f"{card.name}: +{pv_per} PV par Kdo")
 
-        kdo_atk_match = _KDO_ATK_EXTRA_PATTERN.search(bonus)
+        kdo_atk_match = matches.kdo_atk_extra
         if kdo_atk_match:
             atk_extra = int(kdo_atk_match.group(1))
             result.kdo_atk_bonus += atk_extra
             result.effects.append(f"{card.name}: +{atk_extra} ATQ par Kdo")
 
         # === IMBLOCABLE SCALING ===
-        imb_scaling_match = _IMBLOCABLE_SCALING_PATTERN.search(bonus)
+        imb_scaling_match = matches.imblocable_scaling
         if imb_scaling_match:
             extra = int(imb_scaling_match.group(1))
             ratio = int(imb_scaling_match.group(2))
@@ -2026,26 +2236,26 @@ def resolve_bonus_text_effects(
             result.effects.append(f"{card.name}: +{extra} imb tous les {ratio} imb")
 
         # === PER-TURN SELF DAMAGE ===
-        per_turn_self_dmg = _PER_TURN_SELF_DAMAGE_PATTERN.search(bonus)
+        per_turn_self_dmg = matches.per_turn_self_damage
         if per_turn_self_dmg:
             dmg = int(per_turn_self_dmg.group(1))
             result.per_turn_self_damage += dmg
             result.effects.append(f"{card.name}: -{dmg} PV/tour")
 
         # === ENEMY HIGH ATK DEBUFF ===
-        enemy_debuff_match = _ENEMY_HIGH_ATK_DEBUFF_PATTERN.search(bonus)
+        enemy_debuff_match = matches.enemy_high_atk_debuff
         if enemy_debuff_match:
             debuff = int(enemy_debuff_match.group(1))
             result.enemy_high_atk_debuff += debuff
             result.effects.append(f"{card.name}: -{debuff} ATQ ennemi fort")
 
         # === FIRE VULNERABILITY ===
-        if _FIRE_VULNERABILITY_PATTERN.search(bonus):
+        if matches.fire_vulnerability:
             result.fire_vulnerability = True
             result.effects.append(f"{card.name}: Vulnérable feu")
 
         # === REDUCED MONTURE THRESHOLD ===
-        reduced_monture_match = _REDUCED_MONTURE_PATTERN.search(bonus)
+        reduced_monture_match = matches.reduced_monture
         if reduced_monture_match:
             threshold = int(reduced_monture_match.group(1))
             if (
@@ -2056,14 +2266,14 @@ def resolve_bonus_text_effects(
             result.effects.append(f"{card.name}: Monture à {threshold}")
 
         # === GOLD IF IMBLOCABLE ===
-        gold_imb_match = _GOLD_IF_IMBLOCABLE_PATTERN.search(bonus)
+        gold_imb_match = matches.gold_if_imblocable
         if gold_imb_match:
             gold = int(gold_imb_match.group(1))
             result.gold_if_imblocable += gold
             result.effects.append(f"{card.name}: +{gold} or si imb")
 
         # === PV DAMAGE FROM HEALING ===
-        pv_from_heal_match = _PV_DAMAGE_FROM_HEALING_PATTERN.search(bonus)
+        pv_from_heal_match = matches.pv_damage_from_healing
         if pv_from_heal_match:
             dmg_per_heal = int(pv_from_heal_match.group(1))
             result.pv_damage_from_healing = max(
@@ -2072,13 +2282,13 @@ def resolve_bonus_text_effects(
             result.effects.append(f"{card.name}: {dmg_per_heal} dgt par PV rendu")
 
         # === CLASS BONUS THRESHOLD ===
-        class_bonus_match = _CLASS_BONUS_THRESHOLD_PATTERN.search(bonus)
+        class_bonus_match = matches.class_bonus_threshold
         if class_bonus_match:
             atk_val = int(class_bonus_match.group(1))
-            class_name = class_bonus_match.group(2).lower()
+            class_name = class_bonus_match.group(2)
             threshold = int(class_bonus_match.group(3))
-            if class_name in class_map_lower:
-                target_class = class_map_lower[class_name]
+            if class_name in _BONUS_TARGET_CLASSES:
+                target_class = _BONUS_TARGET_CLASSES[class_name]
                 if class_counts.get(target_class, 0) >= threshold:
                     result.attack_bonus += atk_val
                     result.effects.append(
@@ -2086,26 +2296,23 @@ def resolve_bonus_text_effects(
                     )
 
         # === FAMILY COUNT THRESHOLD ===
-        family_count_match = _FAMILY_COUNT_THRESHOLD_PATTERN.search(bonus)
+        family_count_match = matches.family_count_threshold
         if family_count_match:
             atk_val = int(family_count_match.group(1))
-            threshold = int(family_count_match.group(2))
-            # Check raccoon/lapin/raton family
-            if "raccoon" in bonus_lower or "raton" in bonus_lower:
-                if family_counts.get(Family.RATON, 0) >= threshold:
-                    result.attack_bonus += atk_val
-                    result.effects.append(
-                        f"{card.name}: +{atk_val} ATQ (raton {threshold})"
-                    )
-            elif "lapin" in bonus_lower:
-                if family_counts.get(Family.LAPIN, 0) >= threshold:
-                    result.attack_bonus += atk_val
-                    result.effects.append(
-                        f"{card.name}: +{atk_val} ATQ (lapin {threshold})"
-                    )
+            threshold = int(family_count_match.group(3))
+            # The captured family word picks lapin vs raccoon/raton directly
+            if family_count_match.group(2).startswith("lapin"):
+                family, label = Family.LAPIN, "lapin"
+            else:
+                family, label = Family.RATON, "raton"
+            if family_counts.get(family, 0) >= threshold:
+                result.attack_bonus += atk_val
+                result.effects.append(
+                    f"{card.name}: +{atk_val} ATQ ({label} {threshold})"
+                )
 
         # === HALL OF WIN THRESHOLD ===
-        hall_match = _HALL_OF_WIN_THRESHOLD_PATTERN.search(bonus)
+        hall_match = matches.hall_of_win_threshold
         if hall_match:
             atk_val = int(hall_match.group(1))
             threshold = int(hall_match.group(2))
@@ -2114,7 +2321,7 @@ def resolve_bonus_text_effects(
                 result.effects.append(f"{card.name}: +{atk_val} ATQ (Hall {threshold})")
 
         # === CYBORG AND S-TEAM COMBINED BONUS ===
-        cyborg_steam_match = _CYBORG_STEAM_BONUS_PATTERN.search(bonus)
+        cyborg_steam_match = matches.cyborg_steam_bonus
         if cyborg_steam_match:
             atk_val = int(cyborg_steam_match.group(1))
             cyborg_count = family_counts.get(Family.CYBORG, 0)
@@ -2128,12 +2335,12 @@ def resolve_bonus_text_effects(
 
         # === WOMEN FAMILY BONUS ===
         # Count female cards of the target family on the player's board
-        women_match = _WOMEN_FAMILY_BONUS_PATTERN.search(bonus)
+        women_match = matches.women_family_bonus
         if women_match:
             atk_val = int(women_match.group(1))
-            target_family_name = women_match.group(2).lower()
-            if target_family_name in family_map:
-                target_fam = family_map[target_family_name]
+            target_family_name = women_match.group(2)
+            if target_family_name in _BONUS_TARGET_FAMILIES:
+                target_fam = _BONUS_TARGET_FAMILIES[target_family_name]
                 # Count actual female cards of the target family
                 women_count = sum(
                     1
@@ -2150,20 +2357,15 @@ def resolve_bonus_text_effects(
     # === DEMON-SPECIFIC EFFECTS ===
     # Demons are normally skipped, but we need to parse their own bonus_text
     # for effects like flat imblocable damage that they inherently have.
-    for card in player.board:
-        if card.card_type != CardType.DEMON:
-            continue
-
-        bonus = card.bonus_text
-        if not bonus:
-            continue
+    for card, bonus in demons:
+        matches = _match_bonus_text(_normalize_text(bonus))
 
         # Strict mode validation for demon bonus_text
-        if strict and not _bonus_text_matches_any_pattern(bonus):
+        if strict and not any(matches):
             raise UnmatchedBonusTextError(card.name, bonus)
 
         # Flat imblocable damage (e.g., "10 dgt imblocable")
-        flat_imb_match = _FLAT_IMBLOCABLE_PATTERN.search(bonus)
+        flat_imb_match = matches.flat_imblocable
         if flat_imb_match:
             imb_damage = int(flat_imb_match.group(1))
             result.flat_imblocable_damage += imb_damage
@@ -2188,8 +2390,9 @@ def get_ability_summary(player: PlayerState) -> str:
 
     if result.class_counts:
         lines.append("\nClass counts:")
+        # Python's sort stays stable with reverse=True, so ties keep board order
         for card_class, count in sorted(
-            result.class_counts.items(), key=lambda x: -x[1]
+            result.class_counts.items(), key=itemgetter(1), reverse=True
         ):
             if count > 0:
                 lines.append(f"  {card_class.value}: {count}")
@@ -2221,7 +2424,7 @@ def get_ability_summary(player: PlayerState) -> str:
     return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class PerTurnEffectResult:
     """Result of resolving per-turn effects for a player.
 
@@ -2238,7 +2441,10 @@ class PerTurnEffectResult:
     cards_with_effects: list[str] = field(default_factory=list)
 
 
-def resolve_per_turn_effects(player: PlayerState) -> PerTurnEffectResult:
+def resolve_per_turn_effects(
+    player: PlayerState,
+    bonus_text_result: BonusTextResult | None = None,
+) -> PerTurnEffectResult:
     """Resolve per-turn effects for a player.
 
     Per-turn effects are effects that apply each turn, such as:
@@ -2252,6 +2458,8 @@ def resolve_per_turn_effects(player: PlayerState) -> PerTurnEffectResult:
 
     Args:
         player: The player whose per-turn effects to resolve.
+        bonus_text_result: The player's bonus_text effects resolved without an
+            opponent, if the caller already has them. Resolved here otherwise.
 
     Returns:
         PerTurnEffectResult with total damage, healing, PO and affected cards.
@@ -2266,7 +2474,8 @@ def resolve_per_turn_effects(player: PlayerState) -> PerTurnEffectResult:
             result.cards_with_effects.append(card.name)
 
     # Handle per-turn bonus_text effects (healing and PO)
-    bonus_text_result = resolve_bonus_text_effects(player, None)
+    if bonus_text_result is None:
+        bonus_text_result = resolve_bonus_text_effects(player, None)
     if bonus_text_result.per_turn_pv_heal > 0:
         result.total_pv_heal += bonus_text_result.per_turn_pv_heal
     if bonus_text_result.per_turn_po > 0:
@@ -2275,7 +2484,10 @@ def resolve_per_turn_effects(player: PlayerState) -> PerTurnEffectResult:
     return result
 
 
-def apply_per_turn_effects(player: PlayerState) -> PerTurnEffectResult:
+def apply_per_turn_effects(
+    player: PlayerState,
+    bonus_text_result: BonusTextResult | None = None,
+) -> PerTurnEffectResult:
     """Apply per-turn effects to a player and return the result.
 
     This function both calculates and applies per-turn effects:
@@ -2287,11 +2499,14 @@ def apply_per_turn_effects(player: PlayerState) -> PerTurnEffectResult:
 
     Args:
         player: The player to apply per-turn effects to.
+        bonus_text_result: The player's bonus_text effects resolved without an
+            opponent, if the caller already has them (see
+            resolve_per_turn_effects).
 
     Returns:
         PerTurnEffectResult with damage, healing, and PO bonus.
     """
-    effects = resolve_per_turn_effects(player)
+    effects = resolve_per_turn_effects(player, bonus_text_result)
 
     # Apply self-damage
     if effects.total_self_damage > 0:
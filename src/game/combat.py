@@ -7,6 +7,7 @@ special damage types (imblocable), and applying damage to players.
 from dataclasses import dataclass, field
 
 from .abilities import (
+    AbilityResolutionResult,
     resolve_all_abilities,
     resolve_bonus_text_effects,
     resolve_conditional_abilities,
@@ -114,6 +115,8 @@ def calculate_damage(
     attacker: PlayerState,
     defender: PlayerState,
     dragon_po_spend: int = 0,
+    attacker_abilities: AbilityResolutionResult | None = None,
+    defender_abilities: AbilityResolutionResult | None = None,
 ) -> DamageBreakdown:
     """Calculate damage from one player to another.
 
@@ -131,13 +134,19 @@ def calculate_damage(
         defender: The defending player.
         dragon_po_spend: Explicit PO to spend on Dragon conditional abilities (OQ006).
             Must be specified explicitly; defaults to 0 (no Dragon abilities activate).
+        attacker_abilities: Already resolved class/family abilities of the
+            attacker. Resolved here if not provided.
+        defender_abilities: Already resolved class/family abilities of the
+            defender. Resolved here if not provided.
 
     Returns:
         DamageBreakdown with full calculation details.
     """
     # Resolve abilities for both players
-    attacker_abilities = resolve_all_abilities(attacker)
-    defender_abilities = resolve_all_abilities(defender)
+    if attacker_abilities is None:
+        attacker_abilities = resolve_all_abilities(attacker)
+    if defender_abilities is None:
+        defender_abilities = resolve_all_abilities(defender)
 
     # Resolve bonus_text effects for both players
     attacker_bonus_text = resolve_bonus_text_effects(attacker, defender)
@@ -288,11 +297,23 @@ def resolve_combat(
     # Calculate all damage first (simultaneous combat)
     damage_to_apply: dict[int, int] = {p.player_id: 0 for p in alive_players}
 
+    # Boards do not change until damage is applied, so each player's
+    # abilities are resolved once and shared by all pairings
+    abilities_by_player = {
+        player.player_id: resolve_all_abilities(player) for player in alive_players
+    }
+
     for attacker in alive_players:
         for defender in alive_players:
             if attacker.player_id != defender.player_id:
                 dragon_po = dragon_po_choices.get(attacker.player_id, 0)
-                breakdown = calculate_damage(attacker, defender, dragon_po)
+                breakdown = calculate_damage(
+                    attacker,
+                    defender,
+                    dragon_po,
+                    attacker_abilities=abilities_by_player[attacker.player_id],
+                    defender_abilities=abilities_by_player[defender.player_id],
+                )
                 result.damage_dealt.append(breakdown)
                 damage_to_apply[defender.player_id] += breakdown.total_damage
 
@@ -350,7 +371,7 @@ def resolve_combat(
 
     # Calculate self-damage from abilities (e.g., Berserker)
     for player in alive_players:
-        abilities = resolve_all_abilities(player)
+        abilities = abilities_by_player[player.player_id]
         if abilities.total_self_damage > 0:
             result.self_damage[player.player_id] = abilities.total_self_damage
             damage_to_apply[player.player_id] += abilities.total_self_damage
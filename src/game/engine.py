@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 from src.cards.models import Card
 
 from .abilities import (
+    BonusTextResult,
     apply_per_turn_effects,
     resolve_bonus_text_effects,
     resolve_forgeron_abilities,
@@ -102,9 +103,15 @@ class GameEngine:
 
     def _start_turn(
         self,
+        bonus_text_results: dict[int, BonusTextResult] | None = None,
     ) -> tuple[dict[int, int], dict[int, int], dict[int, list[str]], dict[int, int]]:
         """Initialize a new turn.
 
+        Args:
+            bonus_text_results: Opponent-less bonus_text results per player,
+                already resolved at the end of the previous turn. Boards do not
+                change in between, so they are reused instead of resolved again.
+
         Returns:
             Tuple of (econome_po_bonus, weapons_drawn, demons_summoned, cost5_drawn)
             dicts per player.
@@ -125,7 +132,11 @@ class GameEngine:
             extra_po = passives.extra_po
 
             # Calculate per-turn PO bonus from bonus_text effects
-            bonus_text = resolve_bonus_text_effects(player, None)
+            bonus_text = None
+            if bonus_text_results is not None:
+                bonus_text = bonus_text_results.get(player.player_id)
+            if bonus_text is None:
+                bonus_text = resolve_bonus_text_effects(player, None)
             extra_po += bonus_text.per_turn_po
 
             player.po = base_po + extra_po
@@ -213,12 +224,16 @@ class GameEngine:
         # Apply per-turn effects (e.g., Mutanus "Vous perdez X PV par tour")
         per_turn_damage: dict[int, int] = {}
         all_eliminations: list[PlayerState] = []
+        # Shared with the next turn's start, which needs the same results
+        bonus_text_results: dict[int, BonusTextResult] = {}
 
         if combat_result:
             all_eliminations = list(combat_result.eliminations)
 
         for player in self.state.get_alive_players():
-            effects = apply_per_turn_effects(player)
+            bonus_text = resolve_bonus_text_effects(player, None)
+            bonus_text_results[player.player_id] = bonus_text
+            effects = apply_per_turn_effects(player, bonus_text)
             # Track net damage (self-damage minus healing)
             net_damage = effects.total_self_damage - effects.total_pv_heal
             if net_damage > 0:
@@ -251,8 +266,8 @@ class GameEngine:
 
         # Start new turn
         self.state.turn += 1
-        econome_bonuses, weapons_drawn, demons_summoned, cost5_drawn = (
-            self._start_turn()
+        econome_bonuses, weapons_drawn, demons_summoned, cost5_drawn = self._start_turn(
+            bonus_text_results
         )
 
         return TurnResult(
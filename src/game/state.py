@@ -4,11 +4,16 @@ This module defines the core game state classes including PlayerState,
 GameState, and related enums for tracking game progression.
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
 
 from configs import DEFAULT_CONFIG, GameConfig
-from src.cards.models import Card, CardType, DemonCard
+from src.cards.models import Card, CardClass, CardType, DemonCard, Family
+
+# Board counts computed by the ability resolver: non-demon cards per class,
+# all cards per family, and the first non-demon card of each class.
+BoardCounts = tuple[Counter[CardClass], Counter[Family], dict[CardClass, Card]]
 
 
 class GamePhase(Enum):
@@ -61,6 +66,12 @@ class PlayerState:
     sacrificed_this_turn: list[Card] = field(default_factory=list)
     # Ninja selection tracking (OQ008)
     ninja_selected: bool = False
+    # Board-derived data cached by the ability resolver, keyed by the identity
+    # of the cards on the board (see src.game.abilities). Not part of the
+    # player's observable state.
+    _board_cache: tuple[tuple[Card, ...], BoardCounts] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate player state after initialization."""
@@ -1,15 +1,18 @@
 """Tests for the ability resolution system."""
 
 from copy import deepcopy
+from dataclasses import FrozenInstanceError
 
 import pytest
 
-from src.cards.models import CardClass
+from src.cards.models import CardClass, ScalingAbility
 from src.cards.repository import get_repository
 from src.game.abilities import (
     AbilityTarget,
     UnmatchedBonusTextError,
     apply_per_turn_effects,
+    count_cards_by_class,
+    count_cards_by_family,
     get_active_scaling_ability,
     parse_ability_effect,
     resolve_all_abilities,
@@ -75,11 +78,32 @@ class TestParseAbilityEffect:
         assert effect.target == AbilityTarget.SPECIFIC
         assert effect.target_class == CardClass.DEFENSEUR
 
+    def test_parse_ignores_case_and_accents(self) -> None:
+        """Test that case and accents do not affect parsing."""
+        for text in ("+2 PV POUR LES DÉFENSEURS", "+2 pv pour les defenseurs"):
+            effect = parse_ability_effect(text)
+            assert effect.health_bonus == 2
+            assert effect.target_class == CardClass.DEFENSEUR
+            assert effect.description == text
+
     def test_parse_all_monsters(self) -> None:
         """Test parsing all-monsters effects."""
         effect = parse_ability_effect("+1 dgt pour tous les monstres")
         assert effect.target == AbilityTarget.ALL_MONSTERS
 
+    def test_parse_overlapping_fragments(self) -> None:
+        """Test that overlapping fragments are all parsed from one scan."""
+        effect = parse_ability_effect("+2 dgt imblocable")
+        assert effect.attack_bonus == 2
+        assert effect.imblocable_damage == 2
+
+    def test_parse_is_cached_and_frozen(self) -> None:
+        """Test that parsed effects are cached and cannot be mutated."""
+        effect = parse_ability_effect("+3 ATQ pour les combattants")
+        assert parse_ability_effect("+3 ATQ pour les combattants") is effect
+        with pytest.raises(FrozenInstanceError):
+            effect.attack_bonus = 10  # type: ignore[misc]
+
 
 class TestGetActiveScalingAbility:
     """Tests for getting active scaling abilities."""
@@ -112,6 +136,45 @@ class TestGetActiveScalingAbility:
         assert result is not None
         assert result.threshold == 4
 
+    def test_unsorted_and_duplicate_thresholds(self) -> None:
+        """Test that order does not matter and ties keep the first ability."""
+        abilities = [
+            ScalingAbility(threshold=4, effect="+4 ATQ"),
+            ScalingAbility(threshold=2, effect="+2 ATQ"),
+            ScalingAbility(threshold=4, effect="+5 ATQ"),
+        ]
+        assert get_active_scaling_ability(abilities, 3) is abilities[1]
+        assert get_active_scaling_ability(abilities, 9) is abilities[0]
+
+
+class TestBoardCounts:
+    """Tests for memoized board counting."""
+
+    def test_counts_follow_board_mutations(self, repo) -> None:
+        """Test that cached counts are refreshed when the board changes."""
+        mutanus = repo.get_by_name_and_level("Mutanus empoisonné", level=1)
+        player = create_initial_game_state(num_players=2).players[0]
+        player.board.append(mutanus)
+        assert count_cards_by_class(player)[CardClass.BERSEKER] == 1
+
+        player.board.append(deepcopy(mutanus))
+        assert count_cards_by_class(player)[CardClass.BERSEKER] == 2
+
+        player.board[1] = repo.get_by_name_and_level("Cyberours", level=1)
+        assert count_cards_by_class(player)[CardClass.BERSEKER] == 1
+
+        player.board.clear()
+        assert not count_cards_by_class(player)
+        assert not count_cards_by_family(player)
+
+    def test_returned_counters_are_copies(self, repo) -> None:
+        """Test that mutating a returned counter does not corrupt the cache."""
+        mutanus = repo.get_by_name_and_level("Mutanus empoisonné", level=1)
+        player = create_initial_game_state(num_players=2).players[0]
+        player.board.append(mutanus)
+        count_cards_by_class(player)[CardClass.BERSEKER] += 5
+        assert count_cards_by_class(player)[CardClass.BERSEKER] == 1
+
 
 class TestResolveClassAbilities:
     """Tests for class ability resolution."""
@@ -277,6 +340,26 @@ class TestCombatWithAbilities:
         expected_defense = breakdown.base_defense + breakdown.defense_bonus
         assert breakdown.target_defense == expected_defense
 
+    def test_precomputed_abilities_match_resolved(self, repo) -> None:
+        """Test that passing already resolved abilities gives the same damage."""
+        mutanus = repo.get_by_name_and_level("Mutanus empoisonné", level=1)
+        defenders = [c for c in repo.get_all() if c.card_class == CardClass.DEFENSEUR]
+
+        state = create_initial_game_state(num_players=2)
+        player1 = state.players[0]
+        player2 = state.players[1]
+        player1.board.extend([deepcopy(mutanus), deepcopy(mutanus)])
+        player2.board.extend([deepcopy(defenders[0]), deepcopy(defenders[0])])
+
+        breakdown = calculate_damage(
+            player1,
+            player2,
+            attacker_abilities=resolve_all_abilities(player1),
+            defender_abilities=resolve_all_abilities(player2),
+        )
+
+        assert breakdown == calculate_damage(player1, player2)
+
 
 class TestResolveAllAbilities:
     """Tests for resolving all abilities (class + family)."""
@@ -333,6 +416,24 @@ class TestPerTurnEffects:
         assert result.total_self_damage == 0
         assert result.cards_with_effects == []
 
+    def test_resolve_per_turn_effects_reuses_bonus_text_result(self, repo) -> None:
+        """Test that a precomputed bonus_text result is used as is."""
+        state = create_initial_game_state(num_players=2)
+        player = state.players[0]
+        lapins = [c for c in repo.get_all() if c.family.value == "Lapin"]
+        for card in lapins[:4]:
+            player.board.append(deepcopy(card))
+
+        bonus_text = resolve_bonus_text_effects(player, None)
+        expected = resolve_per_turn_effects(player)
+        result = resolve_per_turn_effects(player, bonus_text)
+
+        assert result.total_pv_heal == expected.total_pv_heal
+        assert result.total_po_bonus == expected.total_po_bonus
+
+        bonus_text.per_turn_po = 7
+        assert resolve_per_turn_effects(player, bonus_text).total_po_bonus == 7
+
     def test_resolve_per_turn_effects_with_mutanus(self, repo) -> None:
         """Test per-turn resolution with Mutanus on board."""
         mutanus = repo.get_by_name_and_level("Mutanus empoisonné", level=1)
@@ -605,6 +706,31 @@ class TestForgeronAbilities:
 
         assert weapons_to_draw == 0
 
+    def test_forgeron_skips_card_without_scaling(self, repo) -> None:
+        """Test that a Forgeron without scaling defers to the next Forgeron."""
+        from src.game.abilities import resolve_forgeron_abilities
+
+        forgerons = [
+            c
+            for c in repo.get_all()
+            if c.card_class == CardClass.FORGERON and c.class_abilities.scaling
+        ]
+
+        if not forgerons:
+            pytest.skip("No Forgeron cards found")
+
+        state = create_initial_game_state(num_players=2)
+        player = state.players[0]
+        player.board.extend([deepcopy(forgerons[0]), deepcopy(forgerons[0])])
+        expected = resolve_forgeron_abilities(player)
+
+        # Same count, but the first Forgeron carries no scaling abilities
+        player.board[0] = deepcopy(forgerons[0])
+        player.board[0].class_abilities.scaling = []
+
+        assert expected >= 1
+        assert resolve_forgeron_abilities(player) == expected
+
 
 class TestBonusTextEffects:
     """Tests for bonus_text effect parsing and resolution."""
@@ -812,6 +938,26 @@ class TestBonusTextEffects:
         # Should have attack bonus for raccoons
         assert result.attack_bonus >= 0
 
+    def test_family_count_threshold_uses_matched_family(self, repo) -> None:
+        """Test that the family named in the threshold decides, not other words."""
+        from src.cards.models import Family
+
+        lapins = [c for c in repo.get_all() if c.family == Family.LAPIN]
+
+        state = create_initial_game_state(num_players=2)
+        player = state.players[0]
+        for lapin in lapins[:2]:
+            card = deepcopy(lapin)
+            card.bonus_text = None
+            player.board.append(card)
+        player.board[0].bonus_text = "+2 ATQ contre si lapins 2 (pas de raton)"
+
+        result = resolve_bonus_text_effects(player)
+
+        # Two lapins and no raton: the lapin threshold applies
+        assert result.attack_bonus == 2
+        assert any("(lapin 2)" in effect for effect in result.effects)
+
     def test_bonus_text_result_fields(self, repo) -> None:
         """Test that BonusTextResult has all expected fields."""
         from src.game.abilities import resolve_bonus_text_effects
@@ -874,6 +1020,26 @@ class TestOnAttackedDamageInCombat:
 class TestDragonAttackMultipliers:
     """Tests for Dragon attack multiplier conditional abilities."""
 
+    def test_parse_conditional_effect(self) -> None:
+        """Test parsing Dragon conditional effect text."""
+        from src.cards.models import Family
+        from src.game.abilities import parse_conditional_effect
+
+        multiplier = parse_conditional_effect("Quadruple son attaque")
+        assert multiplier.attack_multiplier == 4
+        assert multiplier.applies
+
+        per_card = parse_conditional_effect("+1 ATQ par raton")
+        assert per_card.attack_bonus == 1
+        assert per_card.per_card_bonus == 1
+        assert per_card.per_card_family == Family.RATON
+
+        to_class = parse_conditional_effect("+3 ATQ aux dragons")
+        assert to_class.to_class_bonus == 3
+        assert to_class.to_class_target == CardClass.DRAGON
+
+        assert not parse_conditional_effect("Pioche une carte").applies
+
     def test_dragon_attack_multiplier_parsed(self, repo) -> None:
         """Test that Dragon attack multipliers are recognized with explicit PO."""
         import re
@@ -999,6 +1165,31 @@ class TestInvocateurAbilities:
         assert len(result.demons_to_summon) >= 1
         assert "Diablotin" in result.demons_to_summon
 
+    def test_invocateur_skips_card_without_scaling(self, repo) -> None:
+        """Test that an Invocateur without scaling defers to the next one."""
+        from src.game.abilities import resolve_invocateur_abilities
+
+        invocateurs = [
+            c
+            for c in repo.get_all()
+            if c.card_class == CardClass.INVOCATEUR and c.class_abilities.scaling
+        ]
+
+        if not invocateurs:
+            pytest.skip("No Invocateur cards found")
+
+        state = create_initial_game_state(num_players=2)
+        player = state.players[0]
+        player.board.extend([deepcopy(invocateurs[0]), deepcopy(invocateurs[0])])
+        expected = resolve_invocateur_abilities(player).demons_to_summon
+
+        # Same count, but the first Invocateur carries no scaling abilities
+        player.board[0] = deepcopy(invocateurs[0])
+        player.board[0].class_abilities.scaling = []
+
+        assert expected
+        assert resolve_invocateur_abilities(player).demons_to_summon == expected
+
     def test_invocateur_higher_threshold(self, repo) -> None:
         """Test Invocateur at higher thresholds."""
         from src.game.abilities import resolve_invocateur_abilities